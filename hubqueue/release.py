@@ -26,7 +26,8 @@ def update_version(directory=".", version=None, pattern=None, files=None):
         files (list, optional): List of files to update. If None, searches for common files.
         
     Returns:
-        dict: Dictionary with old and new version, and list of updated files
+        dict: Dictionary with old and new version, list of updated files, and
+            the new content written to each updated file
     """
     # Default pattern for semantic versioning
     if not pattern:
@@ -92,6 +93,7 @@ def update_version(directory=".", version=None, pattern=None, files=None):
     
     # Update files
     updated_files = []
+    contents = {}
     for file_path in existing_files:
         with open(file_path, "r", encoding="utf-8") as f:
             content = f.read()
@@ -101,12 +103,14 @@ def update_version(directory=".", version=None, pattern=None, files=None):
             with open(file_path, "w", encoding="utf-8") as f:
                 f.write(new_content)
             updated_files.append(str(file_path))
+            contents[str(file_path)] = new_content
             logger.debug(f"Updated version in {file_path}")
     
     return {
         "old_version": current_version,
         "new_version": version,
-        "updated_files": updated_files
+        "updated_files": updated_files,
+        "contents": contents
     }
 
 
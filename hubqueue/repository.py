@@ -385,24 +385,15 @@ def stage_and_commit(message, directory=".", files=None):
         str: Commit hash or None if commit failed
     """
     try:
-        # Stage files
-        if files:
-            for file in files:
-                subprocess.run(
-                    ["git", "add", file],
-                    cwd=directory,
-                    check=True,
-                    capture_output=True,
-                    text=True
-                )
-        else:
-            subprocess.run(
-                ["git", "add", "."],
-                cwd=directory,
-                check=True,
-                capture_output=True,
-                text=True
-            )
+        # Stage files in a single git invocation
+        paths = ["--", *files] if files else ["."]
+        subprocess.run(
+            ["git", "add", *paths],
+            cwd=directory,
+            check=True,
+            capture_output=True,
+            text=True
+        )
         
         # Commit changes
         result = subprocess.run(
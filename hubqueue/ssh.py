@@ -80,58 +80,62 @@ def list_local_ssh_keys(ssh_dir=None):
         # Create SSH directory if it doesn't exist
         os.makedirs(ssh_dir, exist_ok=True)
         
-        # List files in SSH directory
+        # List files in SSH directory; scandir entries cache file type and stat
         keys = []
-        for file in os.listdir(ssh_dir):
-            file_path = os.path.join(ssh_dir, file)
-            
-            # Skip directories and non-regular files
-            if not os.path.isfile(file_path):
-                continue
-            
-            # Check if file is a private key
-            is_private_key = file.endswith(".pem") or file.endswith(".key") or (
-                not file.endswith(".pub") and not file.startswith("known_hosts") and
-                not file.startswith("authorized_keys") and not file.startswith("config")
-            )
-            
-            # Check if file is a public key
-            is_public_key = file.endswith(".pub")
-            
-            if is_private_key or is_public_key:
-                # Get key type and fingerprint
-                key_type = None
-                fingerprint = None
-                
-                if is_public_key:
-                    # Read public key
-                    with open(file_path, "r") as f:
-                        content = f.read().strip()
-                        parts = content.split()
-                        if len(parts) >= 2:
-                            key_type = parts[0]
-                            
-                            # Get fingerprint
-                            try:
-                                result = subprocess.run(
-                                    ["ssh-keygen", "-lf", file_path],
-                                    stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-                                )
-                                if result.returncode == 0:
-                                    fingerprint = result.stdout.strip().split()[1]
-                            except Exception:
-                                pass
-                
-                keys.append({
-                    "file": file,
-                    "path": file_path,
-                    "type": "private" if is_private_key else "public",
-                    "key_type": key_type,
-                    "fingerprint": fingerprint,
-                    "size": os.path.getsize(file_path),
-                    "modified": os.path.getmtime(file_path),
-                })
-        
+        with os.scandir(ssh_dir) as entries:
+            for entry in entries:
+                file = entry.name
+                file_path = entry.path
+
+                # Skip directories and non-regular files
+                if not entry.is_file():
+                    continue
+
+                # Check if file is a private key
+                is_private_key = file.endswith(".pem") or file.endswith(".key") or (
+                    not file.endswith(".pub") and not file.startswith("known_hosts") and
+                    not file.startswith("authorized_keys") and not file.startswith("config")
+                )
+
+                # Check if file is a public key
+                is_public_key = file.endswith(".pub")
+
+                if is_private_key or is_public_key:
+                    stat = entry.stat()
+
+                    # Get key type and fingerprint
+                    key_type = None
+                    fingerprint = None
+
+                    if is_public_key:
+                        # Read public key
+                        with open(file_path, "r") as f:
+                            content = f.read().strip()
+                            parts = content.split()
+                            if len(parts) >= 2:
+                                key_type = parts[0]
+
+                                # Get fingerprint
+                                try:
+                                    result = subprocess.run(
+                                        ["ssh-keygen", "-lf", file_path],
+                                        stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+                                    )
+                                    if result.returncode == 0:
+                                        fingerprint = result.stdout.strip().split()[1]
+                                except Exception:
+                                    pass
+
+                    keys.append({
+                        "file": file,
+                        "path": file_path,
+                        "type": "private" if is_private_key else "public",
+                        "key_type": key_type,
+                        "fingerprint": fingerprint,
+                        "size": stat.st_size,
+                        "modified": stat.st_mtime,
+                    })
+
         logger.info(f"Found {len(keys)} local SSH keys")
         return keys
     except Exception as e:
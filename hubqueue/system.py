@@ -8,6 +8,7 @@ import subprocess
 import shutil
 import json
 import tempfile
+from importlib import metadata
 from pathlib import Path
 from . import __version__
 from .logging import get_logger
@@ -50,17 +51,13 @@ def get_system_info():
         system_info["environment_variables"] = env_vars
 
         # Get installed packages
-        try:
-            import pkg_resources
-            packages = []
-            for package in pkg_resources.working_set:
-                packages.append({
-                    "name": package.project_name,
-                    "version": package.version,
-                })
-            system_info["installed_packages"] = packages
-        except ImportError:
-            system_info["installed_packages"] = []
+        system_info["installed_packages"] = [
+            {
+                "name": dist.metadata["Name"],
+                "version": dist.version,
+            }
+            for dist in metadata.distributions()
+        ]
 
         # Get Git information
         try:
@@ -3,26 +3,28 @@ Utility functions for HubQueue.
 """
 import os
 import json
+import functools
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=1)
 def get_config_dir():
-    """Get the configuration directory for HubQueue."""
+    """Get the configuration directory for HubQueue, created on the first call."""
     config_dir = Path.home() / ".hubqueue"
     config_dir.mkdir(exist_ok=True)
     return config_dir
 
 
-def save_config(config_data):
-    """Save configuration data to the config file."""
-    config_file = get_config_dir() / "config.json"
+def save_config(config_data, path=None):
+    """Save configuration data to the config file, or to path if given."""
+    config_file = Path(path) if path else get_config_dir() / "config.json"
     with open(config_file, "w") as f:
         json.dump(config_data, f, indent=2)
 
 
-def load_config():
-    """Load configuration data from the config file."""
-    config_file = get_config_dir() / "config.json"
+def load_config(path=None):
+    """Load configuration data from the config file, or from path if given."""
+    config_file = Path(path) if path else get_config_dir() / "config.json"
     if not config_file.exists():
         return {}
     
@@ -51,10 +51,13 @@ class Wizard:
             # Display wizard header
             self._display_header()
             
+            # Resolve each step's method once per run, after any patching of the instance
+            step_methods = [getattr(self, f"step_{step}", None) for step in self.steps]
+            
             # Run wizard steps
             while self.current_step < len(self.steps):
                 step_name = self.steps[self.current_step]
-                step_method = getattr(self, f"step_{step_name}", None)
+                step_method = step_methods[self.current_step]
                 
                 if step_method:
                     # Display step header
@@ -0,0 +1,69 @@
+"""
+Shared pytest fixtures for the test suite.
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from unittest import mock
+
+import pytest
+from github.Repository import Repository
+
+# The real functions guarded by no_real_subprocess
+_REAL_SUBPROCESS = {"run": subprocess.run, "check_output": subprocess.check_output}
+
+# Modules allowed through no_real_subprocess
+_TRUSTED_CALLERS = {"platform", "subprocess"}
+
+
+@pytest.fixture(scope="session")
+def fast_tmp_root():
+    """Scratch directory for the session, on a RAM-backed filesystem when available."""
+    base = os.environ.get("HUBQUEUE_TEST_TMP")
+    if not base:
+        base = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    os.makedirs(base, exist_ok=True)
+
+    # One root per session, so xdist workers never remove each other's files
+    root = tempfile.mkdtemp(prefix="hubqueue-tests-", dir=base)
+    yield root
+    shutil.rmtree(root, ignore_errors=True)
+
+
+@pytest.fixture
+def temp_dir(fast_tmp_root):
+    """Fresh directory for one test under fast_tmp_root."""
+    return tempfile.mkdtemp(dir=fast_tmp_root)
+
+
+@pytest.fixture(autouse=True)
+def no_real_subprocess(request, monkeypatch):
+    """Fail tests that would spawn a real process without mocking it first."""
+    if request.node.get_closest_marker("allow_subprocess"):
+        return
+
+    def refuse(real):
+        def call(*args, **kwargs):
+            # platform shells out to uname for details it caches, e.g. processor(),
+            # and the check_output it uses goes on to call run
+            if sys._getframe(1).f_globals.get("__name__") in _TRUSTED_CALLERS:
+                return real(*args, **kwargs)
+            raise AssertionError(f"unmocked subprocess call: {args!r}")
+        return call
+
+    # Leave alone anything a test class has already patched
+    for name, real in _REAL_SUBPROCESS.items():
+        if getattr(subprocess, name) is real:
+            monkeypatch.setattr(subprocess, name, refuse(real))
+
+
+@pytest.fixture(scope="session")
+def github_repo():
+    """Factory that points a mocked Github's get_repo at a new Repository mock and returns it."""
+    def wire(mock_github, **repo_attrs):
+        repo = mock.MagicMock(spec_set=Repository, **repo_attrs)
+        mock_github.return_value.get_repo.return_value = repo
+        return repo
+    return wire
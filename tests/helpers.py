@@ -0,0 +1,16 @@
+"""
+Helpers shared by the test modules.
+"""
+import subprocess
+
+
+def completed_process(stdout="", returncode=0):
+    """Build a subprocess result with the given output and exit status."""
+    return subprocess.CompletedProcess(args=[], returncode=returncode, stdout=stdout, stderr="")
+
+
+# Successful subprocess result with no output
+OK = completed_process()
+
+# Keyword arguments hubqueue passes to subprocess.run for git commands
+RUN_KW = {"check": True, "capture_output": True, "text": True}
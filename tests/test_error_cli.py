@@ -4,9 +4,10 @@ Tests for the error_cli module.
 import os
 import sys
 import json
-import tempfile
 from unittest import TestCase, mock
 
+import pytest
+
 from hubqueue.errors import (
     HubQueueError, AuthenticationError, AuthorizationError, NotFoundError,
     ValidationError, RateLimitError, ServerError, ConfigurationError,
@@ -22,11 +23,14 @@ from hubqueue.error_cli import (
 class TestErrorCLI(TestCase):
     """Test error CLI functions."""
 
+    @pytest.fixture(autouse=True)
+    def _temp_dir(self, temp_dir, monkeypatch):
+        """Run each test in a fresh directory, where save_error_report writes by default."""
+        self.temp_dir = temp_dir
+        monkeypatch.chdir(temp_dir)
+
     def setUp(self):
         """Set up test environment."""
-        # Create a temporary directory for tests
-        self.temp_dir = tempfile.mkdtemp()
-        
         # Mock environment variables
         self.env_patcher = mock.patch.dict('os.environ', {}, clear=True)
         self.env_patcher.start()
@@ -40,10 +44,6 @@ class TestErrorCLI(TestCase):
         
         # Restore original debug mode
         set_debug_mode(self.original_debug_mode)
-        
-        # Clean up temporary directory
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
 
     @mock.patch('hubqueue.error_cli.print_error')
     @mock.patch('hubqueue.error_cli.print_info')
@@ -262,6 +262,7 @@ class TestErrorCLI(TestCase):
         result = save_error_report(report)
         
         # Verify result
+        self.assertEqual(os.path.dirname(os.path.realpath(result)), os.path.realpath(self.temp_dir))
         self.assertTrue(os.path.exists(result))
         
         # Verify file content
@@ -0,0 +1,25 @@
+"""
+Tests that modules pass when run on their own, not only after others warm shared caches.
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Repository root, where pytest.ini lives
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.mark.slow
+@pytest.mark.allow_subprocess
+@pytest.mark.parametrize("module", ["tests/test_error_cli.py", "tests/test_system.py"])
+def test_module_passes_alone(module):
+    """Test that a module passes in a fresh interpreter without the rest of the suite."""
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "-q", "-n0", "-p", "no:cacheprovider", module],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
@@ -1,9 +1,13 @@
 """
 Tests for the projects module.
 """
-import tempfile
-import os
-from unittest import TestCase, mock
+from unittest import mock
+
+import pytest
+from github import Github
+from github.Project import Project
+from github.ProjectCard import ProjectCard
+from github.ProjectColumn import ProjectColumn
 
 from hubqueue.projects import (
     list_project_boards, get_project_board, create_project_board,
@@ -13,570 +17,507 @@ from hubqueue.projects import (
     configure_project_automation
 )
 
+# Shared fixture values used by both the mock setup and the expected results
+CARDS_URL = "https://api.github.com/projects/columns/{}/cards"
+PROJECT_URL = "https://github.com/test-user/test-repo/projects/{}"
+TIMESTAMP = "2023-01-01T00:00:00Z"
+
+# Raised by columns that do not hold the card being looked up
+CARD_NOT_FOUND = Exception("Card not found")
+
+# Board returned by create_project_board for the "basic" template
+BASIC_TEMPLATE_BOARD = {
+    "id": 1,
+    "name": "Test Project",
+    "body": "Project created from basic template",
+    "state": "open",
+    "created_at": TIMESTAMP,
+    "updated_at": TIMESTAMP,
+    "html_url": PROJECT_URL.format(1),
+}
+
+# Board returned by get_project_board once the template columns exist
+BASIC_TEMPLATE_PROJECT = {
+    **BASIC_TEMPLATE_BOARD,
+    "columns": [
+        {"id": 1, "name": "To Do", "cards_url": CARDS_URL.format(1), "cards": []},
+        {"id": 2, "name": "In Progress", "cards_url": CARDS_URL.format(2), "cards": []},
+        {"id": 3, "name": "Done", "cards_url": CARDS_URL.format(3), "cards": []},
+    ],
+}
+
+
+def _assert_std_setup(mock_github, repo="test-user/test-repo", token="test-token"):
+    """Assert the client was created with the token and opened the repository."""
+    mock_github.assert_called_once_with(token)
+    mock_github.return_value.get_repo.assert_called_once_with(repo)
+
+
+@pytest.fixture(autouse=True)
+def mock_github(monkeypatch):
+    """Patch the Github client used by the projects module."""
+    m = mock.create_autospec(Github, spec_set=True, instance=False)
+    monkeypatch.setattr("hubqueue.projects.Github", m)
+    return m
+
+
+@pytest.fixture
+def patch_github_exception(monkeypatch):
+    """Let plain exceptions stand in for GithubException in card lookups."""
+    monkeypatch.setattr("hubqueue.projects.GithubException", Exception)
+
+
+@pytest.fixture(scope="module")
+def mock_card_factory():
+    """Return a builder for project card mocks."""
+    def factory(id=1, note=None, created_at=TIMESTAMP, updated_at=TIMESTAMP, content_url=None):
+        return mock.MagicMock(
+            spec_set=ProjectCard,
+            id=id,
+            note=note,
+            created_at=created_at,
+            updated_at=updated_at,
+            content_url=content_url,
+        )
+    return factory
+
+
+@pytest.fixture(scope="module")
+def mock_column_factory():
+    """Return a builder for project column mocks."""
+    def factory(id=1, name="To Do", cards=()):
+        column = mock.MagicMock(
+            spec_set=ProjectColumn,
+            id=id,
+            cards_url=CARDS_URL.format(id),
+            **{"get_cards.return_value": list(cards)},
+        )
+        # MagicMock reserves the name keyword for its repr, so set it afterwards
+        column.name = name
+        return column
+    return factory
+
+
+@pytest.fixture(scope="module")
+def mock_project_factory():
+    """Return a builder for project board mocks."""
+    def factory(id=1, name="Project 1", body="Test Project 1", state="open",
+                created_at=TIMESTAMP, updated_at="2023-01-02T00:00:00Z",
+                columns=()):
+        project = mock.MagicMock(
+            spec_set=Project,
+            id=id,
+            body=body,
+            state=state,
+            created_at=created_at,
+            updated_at=updated_at,
+            html_url=PROJECT_URL.format(id),
+            **{"get_columns.return_value": list(columns)},
+        )
+        # MagicMock reserves the name keyword for its repr, so set it afterwards
+        project.name = name
+        return project
+    return factory
+
+
+@pytest.fixture(params=[0, 1], ids=["found-first", "found-after-search"])
+def card_board(request, mock_github):
+    """Wire a project whose card sits in the first or the second of two columns."""
+    mock_card = mock.MagicMock()
+
+    columns = [mock.MagicMock(**{"get_card.side_effect": CARD_NOT_FOUND}) for _ in range(2)]
+    columns[request.param].get_card.side_effect = None
+    columns[request.param].get_card.return_value = mock_card
+
+    mock_project = mock.MagicMock(**{"get_columns.return_value": columns})
+
+    mock_repo = mock.MagicMock(**{"get_project.return_value": mock_project})
+
+    mock_github.return_value.get_repo.return_value = mock_repo
+
+    return mock_repo, mock_project, mock_card
+
+
+def test_list_project_boards(mock_github, mock_project_factory, mock_column_factory):
+    """Test listing project boards."""
+    # Mock GitHub API
+    mock_project1 = mock_project_factory(columns=[
+        mock_column_factory(id=1, name="To Do"),
+        mock_column_factory(id=2, name="In Progress"),
+    ])
+    mock_project2 = mock_project_factory(
+        id=2,
+        name="Project 2",
+        body="Test Project 2",
+        created_at="2023-01-03T00:00:00Z",
+        updated_at="2023-01-04T00:00:00Z",
+    )
+
+    mock_repo = mock.MagicMock(**{"get_projects.return_value": [mock_project1, mock_project2]})
+
+    mock_github.return_value.get_repo.return_value = mock_repo
+
+    # List project boards
+    projects = list_project_boards("test-user/test-repo", "test-token")
+
+    # Verify result
+    assert projects == [
+        {
+            "id": 1,
+            "name": "Project 1",
+            "body": "Test Project 1",
+            "state": "open",
+            "created_at": TIMESTAMP,
+            "updated_at": "2023-01-02T00:00:00Z",
+            "html_url": PROJECT_URL.format(1),
+            "columns": [
+                {
+                    "id": 1,
+                    "name": "To Do",
+                    "cards_url": CARDS_URL.format(1),
+                },
+                {
+                    "id": 2,
+                    "name": "In Progress",
+                    "cards_url": CARDS_URL.format(2),
+                },
+            ],
+        },
+        {
+            "id": 2,
+            "name": "Project 2",
+            "body": "Test Project 2",
+            "state": "open",
+            "created_at": "2023-01-03T00:00:00Z",
+            "updated_at": "2023-01-04T00:00:00Z",
+            "html_url": PROJECT_URL.format(2),
+            "columns": [],
+        },
+    ]
+
+    # Verify API calls
+    _assert_std_setup(mock_github)
+    mock_repo.get_projects.assert_called_once()
+    mock_project1.get_columns.assert_called_once()
+    mock_project2.get_columns.assert_called_once()
+
+
+def test_get_project_board(mock_github, mock_project_factory, mock_column_factory, mock_card_factory):
+    """Test getting a project board."""
+    # Mock GitHub API
+    mock_card1 = mock_card_factory(note="Test note")
+    mock_card2 = mock_card_factory(
+        id=2,
+        created_at="2023-01-02T00:00:00Z",
+        updated_at="2023-01-02T00:00:00Z",
+        content_url="https://api.github.com/repos/test-user/test-repo/issues/1",
+    )
+
+    mock_issue = mock.MagicMock(number=1, title="Test Issue", state="open")
+
+    mock_column1 = mock_column_factory(cards=[mock_card1, mock_card2])
+    mock_column2 = mock_column_factory(id=2, name="In Progress")
+    mock_project = mock_project_factory(columns=[mock_column1, mock_column2])
+
+    mock_repo = mock.MagicMock(**{
+        "get_project.return_value": mock_project,
+        "get_issue.return_value": mock_issue,
+    })
+
+    mock_github.return_value.get_repo.return_value = mock_repo
+
+    # Get project board
+    project = get_project_board("test-user/test-repo", 1, "test-token")
+
+    # Verify result
+    assert project == {
+        "id": 1,
+        "name": "Project 1",
+        "body": "Test Project 1",
+        "state": "open",
+        "created_at": TIMESTAMP,
+        "updated_at": "2023-01-02T00:00:00Z",
+        "html_url": PROJECT_URL.format(1),
+        "columns": [
+            {
+                "id": 1,
+                "name": "To Do",
+                "cards_url": CARDS_URL.format(1),
+                "cards": [
+                    {
+                        "id": 1,
+                        "note": "Test note",
+                        "created_at": TIMESTAMP,
+                        "updated_at": TIMESTAMP,
+                        "content_url": None,
+                    },
+                    {
+                        "id": 2,
+                        "note": None,
+                        "created_at": "2023-01-02T00:00:00Z",
+                        "updated_at": "2023-01-02T00:00:00Z",
+                        "content_url": "https://api.github.com/repos/test-user/test-repo/issues/1",
+                        "content": {
+                            "type": "issue",
+                            "number": 1,
+                            "title": "Test Issue",
+                            "state": "open",
+                        },
+                    },
+                ],
+            },
+            {
+                "id": 2,
+                "name": "In Progress",
+                "cards_url": CARDS_URL.format(2),
+                "cards": [],
+            },
+        ],
+    }
+
+    # Verify API calls
+    _assert_std_setup(mock_github)
+    mock_repo.get_project.assert_called_once_with(1)
+    mock_project.get_columns.assert_called_once()
+    mock_column1.get_cards.assert_called_once()
+    mock_column2.get_cards.assert_called_once()
+    mock_repo.get_issue.assert_called_once_with(1)
+
+
+def test_create_project_board(mock_github, mock_project_factory):
+    """Test creating a project board."""
+    # Mock GitHub API
+    mock_project = mock_project_factory(
+        name="Test Project",
+        body="Test Project Description",
+        updated_at=TIMESTAMP,
+    )
+
+    mock_repo = mock.MagicMock(**{"create_project.return_value": mock_project})
+
+    mock_github.return_value.get_repo.return_value = mock_repo
+
+    # Create project board
+    project = create_project_board("test-user/test-repo", "Test Project", "Test Project Description", "test-token")
+
+    # Verify result
+    assert project["id"] == 1
+    assert project["name"] == "Test Project"
+    assert project["body"] == "Test Project Description"
+    assert project["state"] == "open"
+    assert project["created_at"] == TIMESTAMP
+    assert project["updated_at"] == TIMESTAMP
+    assert project["html_url"] == PROJECT_URL.format(1)
+
+    # Verify API calls
+    _assert_std_setup(mock_github)
+    mock_repo.create_project.assert_called_once_with("Test Project", "Test Project Description")
+
+
+def test_create_project_column(mock_github, mock_column_factory):
+    """Test creating a project column."""
+    # Mock GitHub API
+    mock_column = mock_column_factory()
+
+    mock_project = mock.MagicMock(**{"create_column.return_value": mock_column})
+
+    mock_repo = mock.MagicMock(**{"get_project.return_value": mock_project})
+
+    mock_github.return_value.get_repo.return_value = mock_repo
+
+    # Create project column
+    column = create_project_column("test-user/test-repo", 1, "To Do", "test-token")
+
+    # Verify result
+    assert column["id"] == 1
+    assert column["name"] == "To Do"
+    assert column["cards_url"] == CARDS_URL.format(1)
+
+    # Verify API calls
+    _assert_std_setup(mock_github)
+    mock_repo.get_project.assert_called_once_with(1)
+    mock_project.create_column.assert_called_once_with("To Do")
+
+
+@pytest.mark.parametrize("add_content,getter,content_type,content_path", [
+    (add_issue_to_project, "get_issue", "Issue", "issues"),
+    (add_pr_to_project, "get_pull", "PullRequest", "pulls"),
+])
+def test_add_content_to_project(mock_github, mock_card_factory, add_content, getter, content_type, content_path):
+    """Test adding an issue or pull request to a project."""
+    content_url = f"https://api.github.com/repos/test-user/test-repo/{content_path}/1"
+
+    # Mock GitHub API
+    mock_card = mock_card_factory(content_url=content_url)
+
+    mock_content = mock.MagicMock(id=101, number=1)
+
+    mock_column = mock.MagicMock(**{"create_card.return_value": mock_card})
+
+    mock_project = mock.MagicMock(**{"get_column.return_value": mock_column})
+
+    mock_repo = mock.MagicMock(**{
+        f"{getter}.return_value": mock_content,
+        "get_project.return_value": mock_project,
+    })
 
-class TestProjects(TestCase):
-    """Test project management functions."""
-
-    def setUp(self):
-        """Set up test environment."""
-        # Create a temporary directory for tests
-        self.temp_dir = tempfile.mkdtemp()
-
-        # Mock environment variables
-        self.env_patcher = mock.patch.dict('os.environ', {}, clear=True)
-        self.env_patcher.start()
-
-    def tearDown(self):
-        """Clean up test environment."""
-        self.env_patcher.stop()
-
-        # Clean up temporary directory
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
-    @mock.patch("hubqueue.projects.Github")
-    def test_list_project_boards(self, mock_github):
-        """Test listing project boards."""
-        # Mock GitHub API
-        mock_column1 = mock.MagicMock()
-        mock_column1.id = 1
-        mock_column1.name = "To Do"
-        mock_column1.cards_url = "https://api.github.com/projects/columns/1/cards"
-
-        mock_column2 = mock.MagicMock()
-        mock_column2.id = 2
-        mock_column2.name = "In Progress"
-        mock_column2.cards_url = "https://api.github.com/projects/columns/2/cards"
-
-        mock_project1 = mock.MagicMock()
-        mock_project1.id = 1
-        mock_project1.name = "Project 1"
-        mock_project1.body = "Test Project 1"
-        mock_project1.state = "open"
-        mock_project1.created_at = "2023-01-01T00:00:00Z"
-        mock_project1.updated_at = "2023-01-02T00:00:00Z"
-        mock_project1.html_url = "https://github.com/test-user/test-repo/projects/1"
-        mock_project1.get_columns.return_value = [mock_column1, mock_column2]
-
-        mock_project2 = mock.MagicMock()
-        mock_project2.id = 2
-        mock_project2.name = "Project 2"
-        mock_project2.body = "Test Project 2"
-        mock_project2.state = "open"
-        mock_project2.created_at = "2023-01-03T00:00:00Z"
-        mock_project2.updated_at = "2023-01-04T00:00:00Z"
-        mock_project2.html_url = "https://github.com/test-user/test-repo/projects/2"
-        mock_project2.get_columns.return_value = []
-
-        mock_repo = mock.MagicMock()
-        mock_repo.get_projects.return_value = [mock_project1, mock_project2]
-
-        mock_github.return_value.get_repo.return_value = mock_repo
-
-        # List project boards
-        projects = list_project_boards("test-user/test-repo", "test-token")
-
-        # Verify result
-        self.assertEqual(len(projects), 2)
-
-        self.assertEqual(projects[0]["id"], 1)
-        self.assertEqual(projects[0]["name"], "Project 1")
-        self.assertEqual(projects[0]["body"], "Test Project 1")
-        self.assertEqual(projects[0]["state"], "open")
-        self.assertEqual(projects[0]["created_at"], "2023-01-01T00:00:00Z")
-        self.assertEqual(projects[0]["updated_at"], "2023-01-02T00:00:00Z")
-        self.assertEqual(projects[0]["html_url"], "https://github.com/test-user/test-repo/projects/1")
-        self.assertEqual(len(projects[0]["columns"]), 2)
-        self.assertEqual(projects[0]["columns"][0]["id"], 1)
-        self.assertEqual(projects[0]["columns"][0]["name"], "To Do")
-        self.assertEqual(projects[0]["columns"][0]["cards_url"], "https://api.github.com/projects/columns/1/cards")
-
-        self.assertEqual(projects[1]["id"], 2)
-        self.assertEqual(projects[1]["name"], "Project 2")
-        self.assertEqual(len(projects[1]["columns"]), 0)
-
-        # Verify API calls
-        mock_github.assert_called_once_with("test-token")
-        mock_github.return_value.get_repo.assert_called_once_with("test-user/test-repo")
-        mock_repo.get_projects.assert_called_once()
-        mock_project1.get_columns.assert_called_once()
-        mock_project2.get_columns.assert_called_once()
-
-    @mock.patch("hubqueue.projects.Github")
-    def test_get_project_board(self, mock_github):
-        """Test getting a project board."""
-        # Mock GitHub API
-        mock_card1 = mock.MagicMock()
-        mock_card1.id = 1
-        mock_card1.note = "Test note"
-        mock_card1.created_at = "2023-01-01T00:00:00Z"
-        mock_card1.updated_at = "2023-01-01T00:00:00Z"
-        mock_card1.content_url = None
-
-        mock_card2 = mock.MagicMock()
-        mock_card2.id = 2
-        mock_card2.note = None
-        mock_card2.created_at = "2023-01-02T00:00:00Z"
-        mock_card2.updated_at = "2023-01-02T00:00:00Z"
-        mock_card2.content_url = "https://api.github.com/repos/test-user/test-repo/issues/1"
-
-        mock_issue = mock.MagicMock()
-        mock_issue.number = 1
-        mock_issue.title = "Test Issue"
-        mock_issue.state = "open"
-
-        mock_column1 = mock.MagicMock()
-        mock_column1.id = 1
-        mock_column1.name = "To Do"
-        mock_column1.cards_url = "https://api.github.com/projects/columns/1/cards"
-        mock_column1.get_cards.return_value = [mock_card1, mock_card2]
-
-        mock_column2 = mock.MagicMock()
-        mock_column2.id = 2
-        mock_column2.name = "In Progress"
-        mock_column2.cards_url = "https://api.github.com/projects/columns/2/cards"
-        mock_column2.get_cards.return_value = []
-
-        mock_project = mock.MagicMock()
-        mock_project.id = 1
-        mock_project.name = "Project 1"
-        mock_project.body = "Test Project 1"
-        mock_project.state = "open"
-        mock_project.created_at = "2023-01-01T00:00:00Z"
-        mock_project.updated_at = "2023-01-02T00:00:00Z"
-        mock_project.html_url = "https://github.com/test-user/test-repo/projects/1"
-        mock_project.get_columns.return_value = [mock_column1, mock_column2]
-
-        mock_repo = mock.MagicMock()
-        mock_repo.get_project.return_value = mock_project
-        mock_repo.get_issue.return_value = mock_issue
-
-        mock_github.return_value.get_repo.return_value = mock_repo
-
-        # Get project board
-        project = get_project_board("test-user/test-repo", 1, "test-token")
-
-        # Verify result
-        self.assertEqual(project["id"], 1)
-        self.assertEqual(project["name"], "Project 1")
-        self.assertEqual(project["body"], "Test Project 1")
-        self.assertEqual(project["state"], "open")
-        self.assertEqual(project["created_at"], "2023-01-01T00:00:00Z")
-        self.assertEqual(project["updated_at"], "2023-01-02T00:00:00Z")
-        self.assertEqual(project["html_url"], "https://github.com/test-user/test-repo/projects/1")
-
-        # Verify columns
-        self.assertEqual(len(project["columns"]), 2)
-        self.assertEqual(project["columns"][0]["id"], 1)
-        self.assertEqual(project["columns"][0]["name"], "To Do")
-        self.assertEqual(project["columns"][0]["cards_url"], "https://api.github.com/projects/columns/1/cards")
-
-        # Verify cards
-        self.assertEqual(len(project["columns"][0]["cards"]), 2)
-        self.assertEqual(project["columns"][0]["cards"][0]["id"], 1)
-        self.assertEqual(project["columns"][0]["cards"][0]["note"], "Test note")
-        self.assertEqual(project["columns"][0]["cards"][0]["created_at"], "2023-01-01T00:00:00Z")
-        self.assertEqual(project["columns"][0]["cards"][0]["updated_at"], "2023-01-01T00:00:00Z")
-        self.assertEqual(project["columns"][0]["cards"][0]["content_url"], None)
-
-        self.assertEqual(project["columns"][0]["cards"][1]["id"], 2)
-        self.assertEqual(project["columns"][0]["cards"][1]["note"], None)
-        self.assertEqual(project["columns"][0]["cards"][1]["content_url"], "https://api.github.com/repos/test-user/test-repo/issues/1")
-        self.assertEqual(project["columns"][0]["cards"][1]["content"]["type"], "issue")
-        self.assertEqual(project["columns"][0]["cards"][1]["content"]["number"], 1)
-        self.assertEqual(project["columns"][0]["cards"][1]["content"]["title"], "Test Issue")
-        self.assertEqual(project["columns"][0]["cards"][1]["content"]["state"], "open")
-
-        # Verify API calls
-        mock_github.assert_called_once_with("test-token")
-        mock_github.return_value.get_repo.assert_called_once_with("test-user/test-repo")
-        mock_repo.get_project.assert_called_once_with(1)
-        mock_project.get_columns.assert_called_once()
-        mock_column1.get_cards.assert_called_once()
-        mock_column2.get_cards.assert_called_once()
-        mock_repo.get_issue.assert_called_once_with(1)
-
-    @mock.patch("hubqueue.projects.Github")
-    def test_create_project_board(self, mock_github):
-        """Test creating a project board."""
-        # Mock GitHub API
-        mock_project = mock.MagicMock()
-        mock_project.id = 1
-        mock_project.name = "Test Project"
-        mock_project.body = "Test Project Description"
-        mock_project.state = "open"
-        mock_project.created_at = "2023-01-01T00:00:00Z"
-        mock_project.updated_at = "2023-01-01T00:00:00Z"
-        mock_project.html_url = "https://github.com/test-user/test-repo/projects/1"
-
-        mock_repo = mock.MagicMock()
-        mock_repo.create_project.return_value = mock_project
-
-        mock_github.return_value.get_repo.return_value = mock_repo
-
-        # Create project board
-        project = create_project_board("test-user/test-repo", "Test Project", "Test Project Description", "test-token")
-
-        # Verify result
-        self.assertEqual(project["id"], 1)
-        self.assertEqual(project["name"], "Test Project")
-        self.assertEqual(project["body"], "Test Project Description")
-        self.assertEqual(project["state"], "open")
-        self.assertEqual(project["created_at"], "2023-01-01T00:00:00Z")
-        self.assertEqual(project["updated_at"], "2023-01-01T00:00:00Z")
-        self.assertEqual(project["html_url"], "https://github.com/test-user/test-repo/projects/1")
-
-        # Verify API calls
-        mock_github.assert_called_once_with("test-token")
-        mock_github.return_value.get_repo.assert_called_once_with("test-user/test-repo")
-        mock_repo.create_project.assert_called_once_with("Test Project", "Test Project Description")
-
-    @mock.patch("hubqueue.projects.Github")
-    def test_create_project_column(self, mock_github):
-        """Test creating a project column."""
-        # Mock GitHub API
-        mock_column = mock.MagicMock()
-        mock_column.id = 1
-        mock_column.name = "To Do"
-        mock_column.cards_url = "https://api.github.com/projects/columns/1/cards"
-
-        mock_project = mock.MagicMock()
-        mock_project.create_column.return_value = mock_column
-
-        mock_repo = mock.MagicMock()
-        mock_repo.get_project.return_value = mock_project
-
-        mock_github.return_value.get_repo.return_value = mock_repo
-
-        # Create project column
-        column = create_project_column("test-user/test-repo", 1, "To Do", "test-token")
-
-        # Verify result
-        self.assertEqual(column["id"], 1)
-        self.assertEqual(column["name"], "To Do")
-        self.assertEqual(column["cards_url"], "https://api.github.com/projects/columns/1/cards")
-
-        # Verify API calls
-        mock_github.assert_called_once_with("test-token")
-        mock_github.return_value.get_repo.assert_called_once_with("test-user/test-repo")
-        mock_repo.get_project.assert_called_once_with(1)
-        mock_project.create_column.assert_called_once_with("To Do")
-
-    @mock.patch("hubqueue.projects.Github")
-    def test_add_issue_to_project(self, mock_github):
-        """Test adding an issue to a project."""
-        # Mock GitHub API
-        mock_card = mock.MagicMock()
-        mock_card.id = 1
-        mock_card.note = None
-        mock_card.created_at = "2023-01-01T00:00:00Z"
-        mock_card.updated_at = "2023-01-01T00:00:00Z"
-        mock_card.content_url = "https://api.github.com/repos/test-user/test-repo/issues/1"
-
-        mock_issue = mock.MagicMock()
-        mock_issue.id = 101
-        mock_issue.number = 1
-
-        mock_column = mock.MagicMock()
-        mock_column.create_card.return_value = mock_card
-
-        mock_project = mock.MagicMock()
-        mock_project.get_column.return_value = mock_column
-
-        mock_repo = mock.MagicMock()
-        mock_repo.get_issue.return_value = mock_issue
-        mock_repo.get_project.return_value = mock_project
+    mock_github.return_value.get_repo.return_value = mock_repo
 
-        mock_github.return_value.get_repo.return_value = mock_repo
+    # Add content to project
+    card = add_content("test-user/test-repo", 1, 2, 1, "test-token")
 
-        # Add issue to project
-        card = add_issue_to_project("test-user/test-repo", 1, 2, 1, "test-token")
+    # Verify result
+    assert card["id"] == 1
+    assert card["note"] is None
+    assert card["created_at"] == TIMESTAMP
+    assert card["updated_at"] == TIMESTAMP
+    assert card["content_url"] == content_url
 
-        # Verify result
-        self.assertEqual(card["id"], 1)
-        self.assertEqual(card["note"], None)
-        self.assertEqual(card["created_at"], "2023-01-01T00:00:00Z")
-        self.assertEqual(card["updated_at"], "2023-01-01T00:00:00Z")
-        self.assertEqual(card["content_url"], "https://api.github.com/repos/test-user/test-repo/issues/1")
+    # Verify API calls
+    _assert_std_setup(mock_github)
+    getattr(mock_repo, getter).assert_called_once_with(1)
+    mock_repo.get_project.assert_called_once_with(1)
+    mock_project.get_column.assert_called_once_with(2)
+    mock_column.create_card.assert_called_once_with(content_id=101, content_type=content_type)
 
-        # Verify API calls
-        mock_github.assert_called_once_with("test-token")
-        mock_github.return_value.get_repo.assert_called_once_with("test-user/test-repo")
-        mock_repo.get_issue.assert_called_once_with(1)
-        mock_repo.get_project.assert_called_once_with(1)
-        mock_project.get_column.assert_called_once_with(2)
-        mock_column.create_card.assert_called_once_with(content_id=101, content_type="Issue")
-
-    @mock.patch("hubqueue.projects.Github")
-    def test_add_pr_to_project(self, mock_github):
-        """Test adding a pull request to a project."""
-        # Mock GitHub API
-        mock_card = mock.MagicMock()
-        mock_card.id = 1
-        mock_card.note = None
-        mock_card.created_at = "2023-01-01T00:00:00Z"
-        mock_card.updated_at = "2023-01-01T00:00:00Z"
-        mock_card.content_url = "https://api.github.com/repos/test-user/test-repo/pulls/1"
-
-        mock_pr = mock.MagicMock()
-        mock_pr.id = 101
-        mock_pr.number = 1
-
-        mock_column = mock.MagicMock()
-        mock_column.create_card.return_value = mock_card
-
-        mock_project = mock.MagicMock()
-        mock_project.get_column.return_value = mock_column
-
-        mock_repo = mock.MagicMock()
-        mock_repo.get_pull.return_value = mock_pr
-        mock_repo.get_project.return_value = mock_project
-
-        mock_github.return_value.get_repo.return_value = mock_repo
-
-        # Add PR to project
-        card = add_pr_to_project("test-user/test-repo", 1, 2, 1, "test-token")
 
-        # Verify result
-        self.assertEqual(card["id"], 1)
-        self.assertEqual(card["note"], None)
-        self.assertEqual(card["created_at"], "2023-01-01T00:00:00Z")
-        self.assertEqual(card["updated_at"], "2023-01-01T00:00:00Z")
-        self.assertEqual(card["content_url"], "https://api.github.com/repos/test-user/test-repo/pulls/1")
+def test_add_note_to_project(mock_github, mock_card_factory):
+    """Test adding a note to a project."""
+    # Mock GitHub API
+    mock_card = mock_card_factory(note="Test note")
 
-        # Verify API calls
-        mock_github.assert_called_once_with("test-token")
-        mock_github.return_value.get_repo.assert_called_once_with("test-user/test-repo")
-        mock_repo.get_pull.assert_called_once_with(1)
-        mock_repo.get_project.assert_called_once_with(1)
-        mock_project.get_column.assert_called_once_with(2)
-        mock_column.create_card.assert_called_once_with(content_id=101, content_type="PullRequest")
-
-    @mock.patch("hubqueue.projects.Github")
-    def test_add_note_to_project(self, mock_github):
-        """Test adding a note to a project."""
-        # Mock GitHub API
-        mock_card = mock.MagicMock()
-        mock_card.id = 1
-        mock_card.note = "Test note"
-        mock_card.created_at = "2023-01-01T00:00:00Z"
-        mock_card.updated_at = "2023-01-01T00:00:00Z"
-        mock_card.content_url = None
-
-        mock_column = mock.MagicMock()
-        mock_column.create_card.return_value = mock_card
-
-        mock_project = mock.MagicMock()
-        mock_project.get_column.return_value = mock_column
-
-        mock_repo = mock.MagicMock()
-        mock_repo.get_project.return_value = mock_project
-
-        mock_github.return_value.get_repo.return_value = mock_repo
-
-        # Add note to project
-        card = add_note_to_project("test-user/test-repo", 1, 2, "Test note", "test-token")
+    mock_column = mock.MagicMock(**{"create_card.return_value": mock_card})
 
-        # Verify result
-        self.assertEqual(card["id"], 1)
-        self.assertEqual(card["note"], "Test note")
-        self.assertEqual(card["created_at"], "2023-01-01T00:00:00Z")
-        self.assertEqual(card["updated_at"], "2023-01-01T00:00:00Z")
-        self.assertEqual(card["content_url"], None)
+    mock_project = mock.MagicMock(**{"get_column.return_value": mock_column})
 
-        # Verify API calls
-        mock_github.assert_called_once_with("test-token")
-        mock_github.return_value.get_repo.assert_called_once_with("test-user/test-repo")
-        mock_repo.get_project.assert_called_once_with(1)
-        mock_project.get_column.assert_called_once_with(2)
-        mock_column.create_card.assert_called_once_with(note="Test note")
+    mock_repo = mock.MagicMock(**{"get_project.return_value": mock_project})
 
-    @mock.patch("hubqueue.projects.Github")
-    @mock.patch("hubqueue.projects.GithubException", new=Exception)
-    def test_move_project_card(self, mock_github):
-        """Test moving a project card."""
-        # Mock GitHub API
-        mock_card = mock.MagicMock()
+    mock_github.return_value.get_repo.return_value = mock_repo
 
-        mock_column1 = mock.MagicMock()
-        mock_column1.get_card.side_effect = Exception("Card not found")
+    # Add note to project
+    card = add_note_to_project("test-user/test-repo", 1, 2, "Test note", "test-token")
 
-        mock_column2 = mock.MagicMock()
-        mock_column2.get_card.return_value = mock_card
+    # Verify result
+    assert card["id"] == 1
+    assert card["note"] == "Test note"
+    assert card["created_at"] == TIMESTAMP
+    assert card["updated_at"] == TIMESTAMP
+    assert card["content_url"] is None
 
-        mock_target_column = mock.MagicMock()
+    # Verify API calls
+    _assert_std_setup(mock_github)
+    mock_repo.get_project.assert_called_once_with(1)
+    mock_project.get_column.assert_called_once_with(2)
+    mock_column.create_card.assert_called_once_with(note="Test note")
 
-        mock_project = mock.MagicMock()
-        mock_project.get_columns.return_value = [mock_column1, mock_column2]
-        mock_project.get_column.return_value = mock_target_column
 
-        mock_repo = mock.MagicMock()
-        mock_repo.get_project.return_value = mock_project
+@pytest.mark.usefixtures("patch_github_exception")
+@pytest.mark.parametrize("action", ["move", "delete"])
+def test_project_card_action(mock_github, card_board, action):
+    """Test moving and deleting a project card found by searching the columns."""
+    mock_repo, mock_project, mock_card = card_board
 
-        mock_github.return_value.get_repo.return_value = mock_repo
+    mock_target_column = mock.MagicMock()
+    mock_project.get_column.return_value = mock_target_column
 
-        # Move card
+    # Move or delete card
+    if action == "move":
         result = move_project_card("test-user/test-repo", 1, 2, 3, "top", "test-token")
+    else:
+        result = delete_project_card("test-user/test-repo", 1, 2, "test-token")
 
-        # Verify result
-        self.assertTrue(result)
+    # Verify result
+    assert result
 
-        # Verify API calls
-        mock_github.assert_called_once_with("test-token")
-        mock_github.return_value.get_repo.assert_called_once_with("test-user/test-repo")
-        mock_repo.get_project.assert_called_once_with(1)
+    # Verify API calls
+    _assert_std_setup(mock_github)
+    mock_repo.get_project.assert_called_once_with(1)
+    if action == "move":
         mock_project.get_column.assert_called_once_with(3)
         mock_card.move.assert_called_once_with(position="top", column=mock_target_column)
+    else:
+        mock_card.delete.assert_called_once()
 
-    @mock.patch("hubqueue.projects.Github")
-    @mock.patch("hubqueue.projects.GithubException", new=Exception)
-    def test_delete_project_card(self, mock_github):
-        """Test deleting a project card."""
-        # Mock GitHub API
-        mock_card = mock.MagicMock()
 
-        mock_column1 = mock.MagicMock()
-        mock_column1.get_card.side_effect = Exception("Card not found")
+def test_delete_project_column(mock_github):
+    """Test deleting a project column."""
+    # Mock GitHub API
+    mock_column = mock.MagicMock()
 
-        mock_column2 = mock.MagicMock()
-        mock_column2.get_card.return_value = mock_card
+    mock_project = mock.MagicMock(**{"get_column.return_value": mock_column})
 
-        mock_project = mock.MagicMock()
-        mock_project.get_columns.return_value = [mock_column1, mock_column2]
+    mock_repo = mock.MagicMock(**{"get_project.return_value": mock_project})
 
-        mock_repo = mock.MagicMock()
-        mock_repo.get_project.return_value = mock_project
+    mock_github.return_value.get_repo.return_value = mock_repo
 
-        mock_github.return_value.get_repo.return_value = mock_repo
+    # Delete column
+    result = delete_project_column("test-user/test-repo", 1, 2, "test-token")
 
-        # Delete card
-        result = delete_project_card("test-user/test-repo", 1, 2, "test-token")
+    # Verify result
+    assert result
 
-        # Verify result
-        self.assertTrue(result)
+    # Verify API calls
+    _assert_std_setup(mock_github)
+    mock_repo.get_project.assert_called_once_with(1)
+    mock_project.get_column.assert_called_once_with(2)
+    mock_column.delete.assert_called_once()
 
-        # Verify API calls
-        mock_github.assert_called_once_with("test-token")
-        mock_github.return_value.get_repo.assert_called_once_with("test-user/test-repo")
-        mock_repo.get_project.assert_called_once_with(1)
-        mock_card.delete.assert_called_once()
 
-    @mock.patch("hubqueue.projects.Github")
-    def test_delete_project_column(self, mock_github):
-        """Test deleting a project column."""
-        # Mock GitHub API
-        mock_column = mock.MagicMock()
+def test_delete_project_board(mock_github):
+    """Test deleting a project board."""
+    # Mock GitHub API
+    mock_project = mock.MagicMock()
 
-        mock_project = mock.MagicMock()
-        mock_project.get_column.return_value = mock_column
+    mock_repo = mock.MagicMock(**{"get_project.return_value": mock_project})
 
-        mock_repo = mock.MagicMock()
-        mock_repo.get_project.return_value = mock_project
+    mock_github.return_value.get_repo.return_value = mock_repo
 
-        mock_github.return_value.get_repo.return_value = mock_repo
+    # Delete project
+    result = delete_project_board("test-user/test-repo", 1, "test-token")
 
-        # Delete column
-        result = delete_project_column("test-user/test-repo", 1, 2, "test-token")
+    # Verify result
+    assert result
 
-        # Verify result
-        self.assertTrue(result)
-
-        # Verify API calls
-        mock_github.assert_called_once_with("test-token")
-        mock_github.return_value.get_repo.assert_called_once_with("test-user/test-repo")
-        mock_repo.get_project.assert_called_once_with(1)
-        mock_project.get_column.assert_called_once_with(2)
-        mock_column.delete.assert_called_once()
+    # Verify API calls
+    _assert_std_setup(mock_github)
+    mock_repo.get_project.assert_called_once_with(1)
+    mock_project.delete.assert_called_once()
 
-    @mock.patch("hubqueue.projects.Github")
-    def test_delete_project_board(self, mock_github):
-        """Test deleting a project board."""
-        # Mock GitHub API
-        mock_project = mock.MagicMock()
 
-        mock_repo = mock.MagicMock()
-        mock_repo.get_project.return_value = mock_project
+def test_create_project_from_template():
+    """Test creating a project from a template."""
+    # Mock create_project_board by patching the functions it calls
+    with mock.patch.multiple(
+        "hubqueue.projects",
+        create_project_board=mock.DEFAULT,
+        create_project_column=mock.DEFAULT,
+        get_project_board=mock.DEFAULT,
+    ) as mocks:
+        mock_create_project = mocks["create_project_board"]
+        mock_create_column = mocks["create_project_column"]
+        mock_get_project = mocks["get_project_board"]
 
-        mock_github.return_value.get_repo.return_value = mock_repo
+        mock_create_project.return_value = BASIC_TEMPLATE_BOARD
+        mock_get_project.return_value = BASIC_TEMPLATE_PROJECT
 
-        # Delete project
-        result = delete_project_board("test-user/test-repo", 1, "test-token")
+        # Create project from template
+        project = create_project_from_template("test-user/test-repo", "Test Project", "basic", "test-token")
 
         # Verify result
-        self.assertTrue(result)
+        assert project["id"] == 1
+        assert project["name"] == "Test Project"
+        assert len(project["columns"]) == 3
+        assert project["columns"][0]["name"] == "To Do"
+        assert project["columns"][1]["name"] == "In Progress"
+        assert project["columns"][2]["name"] == "Done"
 
         # Verify API calls
-        mock_github.assert_called_once_with("test-token")
-        mock_github.return_value.get_repo.assert_called_once_with("test-user/test-repo")
-        mock_repo.get_project.assert_called_once_with(1)
-        mock_project.delete.assert_called_once()
-
-    @mock.patch("hubqueue.projects.Github")
-    def test_create_project_from_template(self, mock_github):
-        """Test creating a project from a template."""
-        # Mock create_project_board by patching the functions it calls
-        with mock.patch("hubqueue.projects.create_project_board") as mock_create_project:
-            with mock.patch("hubqueue.projects.create_project_column") as mock_create_column:
-                with mock.patch("hubqueue.projects.get_project_board") as mock_get_project:
-                    # Mock create_project_board
-                    mock_create_project.return_value = {
-                        "id": 1,
-                        "name": "Test Project",
-                        "body": "Project created from basic template",
-                        "state": "open",
-                        "created_at": "2023-01-01T00:00:00Z",
-                        "updated_at": "2023-01-01T00:00:00Z",
-                        "html_url": "https://github.com/test-user/test-repo/projects/1",
-                    }
-
-                    # Mock get_project_board
-                    mock_get_project.return_value = {
-                        "id": 1,
-                        "name": "Test Project",
-                        "body": "Project created from basic template",
-                        "state": "open",
-                        "created_at": "2023-01-01T00:00:00Z",
-                        "updated_at": "2023-01-01T00:00:00Z",
-                        "html_url": "https://github.com/test-user/test-repo/projects/1",
-                        "columns": [
-                            {
-                                "id": 1,
-                                "name": "To Do",
-                                "cards_url": "https://api.github.com/projects/columns/1/cards",
-                                "cards": [],
-                            },
-                            {
-                                "id": 2,
-                                "name": "In Progress",
-                                "cards_url": "https://api.github.com/projects/columns/2/cards",
-                                "cards": [],
-                            },
-                            {
-                                "id": 3,
-                                "name": "Done",
-                                "cards_url": "https://api.github.com/projects/columns/3/cards",
-                                "cards": [],
-                            },
-                        ],
-                    }
-
-                    # Create project from template
-                    project = create_project_from_template("test-user/test-repo", "Test Project", "basic", "test-token")
-
-                    # Verify result
-                    self.assertEqual(project["id"], 1)
-                    self.assertEqual(project["name"], "Test Project")
-                    self.assertEqual(len(project["columns"]), 3)
-                    self.assertEqual(project["columns"][0]["name"], "To Do")
-                    self.assertEqual(project["columns"][1]["name"], "In Progress")
-                    self.assertEqual(project["columns"][2]["name"], "Done")
-
-                    # Verify API calls
-                    mock_create_project.assert_called_once_with(
-                        "test-user/test-repo", "Test Project", "Project created from basic template", "test-token"
-                    )
-                    self.assertEqual(mock_create_column.call_count, 3)
-                    mock_create_column.assert_any_call("test-user/test-repo", 1, "To Do", "test-token")
-                    mock_create_column.assert_any_call("test-user/test-repo", 1, "In Progress", "test-token")
-                    mock_create_column.assert_any_call("test-user/test-repo", 1, "Done", "test-token")
-                    mock_get_project.assert_called_once_with("test-user/test-repo", 1, "test-token")
+        mock_create_project.assert_called_once_with(
+            "test-user/test-repo", "Test Project", "Project created from basic template", "test-token"
+        )
+        mock_create_column.assert_has_calls([
+            mock.call("test-user/test-repo", 1, name, "test-token")
+            for name in ("To Do", "In Progress", "Done")
+        ], any_order=True)
+        assert mock_create_column.call_count == 3
+        mock_get_project.assert_called_once_with("test-user/test-repo", 1, "test-token")
@@ -1,46 +1,105 @@
 """
 Tests for the release module.
 """
+import functools
 import tempfile
-import subprocess
+from dataclasses import dataclass
 from pathlib import Path
-from unittest import TestCase, mock
+from unittest import mock
 
+import pytest
+from pyfakefs import fake_filesystem_unittest
+
+from hubqueue import release as release_mod
 from hubqueue.release import (
     update_version, create_tag, push_tag,
     generate_release_notes, create_github_release,
     upload_release_asset
 )
 
+from tests.helpers import OK, RUN_KW, completed_process
+
+
+@dataclass(frozen=True)
+class FakeRelease:
+    """Data-only stand-in for a github GitRelease."""
+
+    __slots__ = ("id", "tag_name", "title", "body", "draft", "prerelease", "created_at", "html_url")
+
+    id: int
+    tag_name: str
+    title: str
+    body: str
+    draft: bool
+    prerelease: bool
+    created_at: str
+    html_url: str
+
+
+@dataclass(frozen=True)
+class FakeAsset:
+    """Data-only stand-in for a github GitReleaseAsset."""
+
+    __slots__ = ("id", "name", "label", "content_type", "size", "download_count", "browser_download_url")
 
-class TestRelease(TestCase):
+    id: int
+    name: str
+    label: str
+    content_type: str
+    size: int
+    download_count: int
+    browser_download_url: str
+
+
+class TestRelease(fake_filesystem_unittest.TestCase):
     """Test release management functions."""
 
-    def setUp(self):
-        """Set up test environment."""
-        # Create a temporary directory for tests
-        self.temp_dir = tempfile.mkdtemp()
-        
+    @classmethod
+    def setUpClass(cls):
+        """Set up resources shared by the tests in this class."""
+        # Run the class against an in-memory filesystem
+        cls.setUpClassPyfakefs()
+
+        # Create a root temporary directory for the class
+        cls.temp_root = tempfile.mkdtemp()
+
         # Mock environment variables
-        self.env_patcher = mock.patch.dict('os.environ', {}, clear=True)
-        self.env_patcher.start()
+        cls.env_patcher = mock.patch.dict('os.environ', {}, clear=True)
+        cls.env_patcher.start()
 
-    def tearDown(self):
-        """Clean up test environment."""
-        self.env_patcher.stop()
-        
-        # Clean up temporary directory
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up shared resources."""
+        cls.env_patcher.stop()
+
+    @pytest.fixture(autouse=True)
+    def _github_repo(self, github_repo):
+        """Make the shared github_repo factory available to the tests."""
+        self.github_repo = github_repo
+
+    @functools.cached_property
+    def temp_dir(self):
+        """Temporary directory for the current test, created on first use."""
+        return tempfile.mkdtemp(dir=self.temp_root)
+
+    @functools.cached_property
+    def tmp(self):
+        """temp_dir as a Path."""
+        return Path(self.temp_dir)
+
+    @functools.cached_property
+    def run_kw(self):
+        """Keyword arguments expected for subprocess.run calls in temp_dir."""
+        return {"cwd": self.temp_dir, **RUN_KW}
 
     def test_update_version(self):
         """Test updating version identifiers in files."""
         # Create test files
-        init_file = Path(self.temp_dir) / "__init__.py"
+        init_file = self.tmp / "__init__.py"
         with open(init_file, "w") as f:
             f.write('__version__ = "1.0.0"')
         
-        setup_file = Path(self.temp_dir) / "setup.py"
+        setup_file = self.tmp / "setup.py"
         with open(setup_file, "w") as f:
             f.write('setup(\n    version="1.0.0",\n)')
         
@@ -64,7 +123,7 @@ class TestRelease(TestCase):
     def test_update_version_auto_increment(self):
         """Test auto-incrementing version."""
         # Create test file
-        init_file = Path(self.temp_dir) / "__init__.py"
+        init_file = self.tmp / "__init__.py"
         with open(init_file, "w") as f:
             f.write('__version__ = "1.0.0"')
         
@@ -74,16 +133,12 @@ class TestRelease(TestCase):
         # Verify result
         self.assertEqual(result["old_version"], "1.0.0")
         self.assertEqual(result["new_version"], "1.0.1")
-        
-        # Verify file contents
-        with open(init_file, "r") as f:
-            content = f.read()
-            self.assertIn('__version__ = "1.0.1"', content)
+        self.assertIn('__version__ = "1.0.1"', result["contents"][str(init_file)])
 
     def test_update_version_custom_pattern(self):
         """Test updating version with custom pattern."""
         # Create test file
-        version_file = Path(self.temp_dir) / "version.txt"
+        version_file = self.tmp / "version.txt"
         with open(version_file, "w") as f:
             f.write('Version: v1.0')
         
@@ -93,17 +148,13 @@ class TestRelease(TestCase):
         # Verify result
         self.assertEqual(result["old_version"], "v1.0")
         self.assertEqual(result["new_version"], "v2.0")
-        
-        # Verify file contents
-        with open(version_file, "r") as f:
-            content = f.read()
-            self.assertIn('Version: v2.0', content)
+        self.assertIn('Version: v2.0', result["contents"][str(version_file)])
 
-    @mock.patch("subprocess.run")
+    @mock.patch.object(release_mod.subprocess, "run")
     def test_create_tag(self, mock_run):
         """Test creating a Git tag."""
         # Mock subprocess.run
-        mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr="")
+        mock_run.return_value = OK
         
         # Create tag
         tag_name = create_tag("v1.0.0", "Release v1.0.0", self.temp_dir, False)
@@ -114,17 +165,14 @@ class TestRelease(TestCase):
         # Verify subprocess call
         mock_run.assert_called_once_with(
             ["git", "tag", "-a", "v1.0.0", "-m", "Release v1.0.0"],
-            cwd=self.temp_dir,
-            check=True,
-            capture_output=True,
-            text=True
+            **self.run_kw
         )
 
-    @mock.patch("subprocess.run")
+    @mock.patch.object(release_mod.subprocess, "run")
     def test_create_signed_tag(self, mock_run):
         """Test creating a signed Git tag."""
         # Mock subprocess.run
-        mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr="")
+        mock_run.return_value = OK
         
         # Create signed tag
         tag_name = create_tag("v1.0.0", "Release v1.0.0", self.temp_dir, True)
@@ -135,17 +183,14 @@ class TestRelease(TestCase):
         # Verify subprocess call
         mock_run.assert_called_once_with(
             ["git", "tag", "-s", "-a", "v1.0.0", "-m", "Release v1.0.0"],
-            cwd=self.temp_dir,
-            check=True,
-            capture_output=True,
-            text=True
+            **self.run_kw
         )
 
-    @mock.patch("subprocess.run")
+    @mock.patch.object(release_mod.subprocess, "run")
     def test_push_tag(self, mock_run):
         """Test pushing a Git tag."""
         # Mock subprocess.run
-        mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr="")
+        mock_run.return_value = OK
         
         # Push tag
         result = push_tag("v1.0.0", "origin", self.temp_dir)
@@ -156,26 +201,18 @@ class TestRelease(TestCase):
         # Verify subprocess call
         mock_run.assert_called_once_with(
             ["git", "push", "origin", "v1.0.0"],
-            cwd=self.temp_dir,
-            check=True,
-            capture_output=True,
-            text=True
+            **self.run_kw
         )
 
-    @mock.patch("subprocess.run")
+    @mock.patch.object(release_mod.subprocess, "run")
     def test_generate_release_notes(self, mock_run):
         """Test generating release notes."""
         # Mock subprocess.run
         mock_run.side_effect = [
             # git describe
-            subprocess.CompletedProcess(args=[], returncode=0, stdout="v0.9.0", stderr=""),
+            completed_process("v0.9.0"),
             # git log
-            subprocess.CompletedProcess(
-                args=[], 
-                returncode=0, 
-                stdout="abc123 feat: Add new feature (User1)\ndef456 fix: Fix bug (User2)\nghi789 docs: Update docs (User3)",
-                stderr=""
-            )
+            completed_process("abc123 feat: Add new feature (User1)\ndef456 fix: Fix bug (User2)\nghi789 docs: Update docs (User3)")
         ]
         
         # Generate release notes
@@ -190,24 +227,22 @@ class TestRelease(TestCase):
         self.assertIn("## Documentation", notes)
         self.assertIn("* ghi789 docs: Update docs (User3)", notes)
 
-    @mock.patch("hubqueue.release.Github")
+    @mock.patch.object(release_mod, "Github")
     def test_create_github_release(self, mock_github):
         """Test creating a GitHub release."""
         # Mock GitHub API
-        mock_release = mock.MagicMock()
-        mock_release.id = 12345
-        mock_release.tag_name = "v1.0.0"
-        mock_release.title = "v1.0.0"
-        mock_release.body = "Release notes"
-        mock_release.draft = False
-        mock_release.prerelease = False
-        mock_release.created_at = "2023-01-01T00:00:00Z"
-        mock_release.html_url = "https://github.com/test-user/test-repo/releases/tag/v1.0.0"
-        
-        mock_repo = mock.MagicMock()
-        mock_repo.create_git_release.return_value = mock_release
+        mock_release = FakeRelease(
+            id=12345,
+            tag_name="v1.0.0",
+            title="v1.0.0",
+            body="Release notes",
+            draft=False,
+            prerelease=False,
+            created_at="2023-01-01T00:00:00Z",
+            html_url="https://github.com/test-user/test-repo/releases/tag/v1.0.0",
+        )
         
-        mock_github.return_value.get_repo.return_value = mock_repo
+        mock_repo = self.github_repo(mock_github, **{"create_git_release.return_value": mock_release})
         
         # Create GitHub release
         release = create_github_release(
@@ -241,30 +276,27 @@ class TestRelease(TestCase):
             prerelease=False
         )
 
-    @mock.patch("hubqueue.release.Path.exists")
-    @mock.patch("hubqueue.release.Github")
-    def test_upload_release_asset(self, mock_github, mock_exists):
+    @mock.patch.object(release_mod, "Github")
+    def test_upload_release_asset(self, mock_github):
         """Test uploading a release asset."""
-        # Mock Path.exists
-        mock_exists.return_value = True
+        # Create the asset on the fake filesystem
+        self.fake_fs().create_file("test-asset.zip")
         
         # Mock GitHub API
-        mock_asset = mock.MagicMock()
-        mock_asset.id = 67890
-        mock_asset.name = "test-asset.zip"
-        mock_asset.label = "test-asset.zip"
-        mock_asset.content_type = "application/zip"
-        mock_asset.size = 1024
-        mock_asset.download_count = 0
-        mock_asset.browser_download_url = "https://github.com/test-user/test-repo/releases/download/v1.0.0/test-asset.zip"
+        mock_asset = FakeAsset(
+            id=67890,
+            name="test-asset.zip",
+            label="test-asset.zip",
+            content_type="application/zip",
+            size=1024,
+            download_count=0,
+            browser_download_url="https://github.com/test-user/test-repo/releases/download/v1.0.0/test-asset.zip",
+        )
         
         mock_release = mock.MagicMock()
         mock_release.upload_asset.return_value = mock_asset
         
-        mock_repo = mock.MagicMock()
-        mock_repo.get_release.return_value = mock_release
-        
-        mock_github.return_value.get_repo.return_value = mock_repo
+        mock_repo = self.github_repo(mock_github, **{"get_release.return_value": mock_release})
         
         # Upload release asset
         asset = upload_release_asset(
@@ -2,11 +2,17 @@
 Tests for the repository module.
 """
 import os
+import functools
 import tempfile
-import subprocess
+from dataclasses import dataclass
 from pathlib import Path
 from unittest import TestCase, mock
 
+import pytest
+from github import Github
+from pyfakefs import fake_filesystem_unittest
+
+from hubqueue import repository as repo_mod
 from hubqueue.repository import (
     create_repository, clone_repository, init_repository,
     create_project_directories, generate_gitignore, generate_readme,
@@ -14,43 +20,109 @@ from hubqueue.repository import (
     create_pull_request, fork_repository, manage_collaborators
 )
 
+from tests.helpers import OK, RUN_KW, completed_process
+
+
+@dataclass(frozen=True)
+class FakeRepo:
+    """Data-only stand-in for a github Repository."""
+
+    __slots__ = ("name", "full_name", "description", "private", "html_url", "clone_url", "ssh_url")
+
+    name: str
+    full_name: str
+    description: str
+    private: bool
+    html_url: str
+    clone_url: str
+    ssh_url: str
+
+
+@dataclass(frozen=True)
+class FakePull:
+    """Data-only stand-in for a github PullRequest."""
 
-class TestRepository(TestCase):
+    __slots__ = ("number", "title", "html_url", "state")
+
+    number: int
+    title: str
+    html_url: str
+    state: str
+
+
+class TestRepository(fake_filesystem_unittest.TestCase):
     """Test repository management functions."""
 
-    def setUp(self):
-        """Set up test environment."""
-        # Create a temporary directory for tests
-        self.temp_dir = tempfile.mkdtemp()
+    @classmethod
+    def setUpClass(cls):
+        """Set up resources shared by the tests in this class."""
+        # Run the class against an in-memory filesystem
+        cls.setUpClassPyfakefs()
+
+        # Create a root temporary directory for the class
+        cls.temp_root = tempfile.mkdtemp()
 
         # Mock environment variables
-        self.env_patcher = mock.patch.dict(os.environ, {}, clear=True)
-        self.env_patcher.start()
+        cls.env_patcher = mock.patch.dict(os.environ, {}, clear=True)
+        cls.env_patcher.start()
+
+        # Build the Github autospec once for the class
+        cls.mock_github = mock.create_autospec(Github, instance=False)
 
-    def tearDown(self):
-        """Clean up test environment."""
-        self.env_patcher.stop()
+        # Patch subprocess.run once for the class
+        cls.run_patcher = mock.patch.object(repo_mod.subprocess, "run")
+        cls.mock_run = cls.run_patcher.start()
 
-        # Clean up temporary directory
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up shared resources."""
+        cls.run_patcher.stop()
+        cls.env_patcher.stop()
 
-    @mock.patch("hubqueue.repository.Github")
-    def test_create_repository(self, mock_github):
+    def setUp(self):
+        """Reset the shared mocks and install the Github mock."""
+        self.mock_run.reset_mock(return_value=True, side_effect=True)
+        self.mock_github.reset_mock()
+        patcher = mock.patch.object(repo_mod, "Github", self.mock_github)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @pytest.fixture(autouse=True)
+    def _github_repo(self, github_repo):
+        """Make the shared github_repo factory available to the tests."""
+        self.github_repo = github_repo
+
+    @functools.cached_property
+    def temp_dir(self):
+        """Temporary directory for the current test, created on first use."""
+        return tempfile.mkdtemp(dir=self.temp_root)
+
+    @functools.cached_property
+    def tmp(self):
+        """temp_dir as a Path."""
+        return Path(self.temp_dir)
+
+    @functools.cached_property
+    def run_kw(self):
+        """Keyword arguments expected for subprocess.run calls in temp_dir."""
+        return {"cwd": self.temp_dir, **RUN_KW}
+
+    def test_create_repository(self):
         """Test creating a repository."""
         # Mock GitHub API
-        mock_repo = mock.MagicMock()
-        mock_repo.name = "test-repo"
-        mock_repo.full_name = "test-user/test-repo"
-        mock_repo.description = "Test repository"
-        mock_repo.private = False
-        mock_repo.html_url = "https://github.com/test-user/test-repo"
-        mock_repo.clone_url = "https://github.com/test-user/test-repo.git"
-        mock_repo.ssh_url = "git@github.com:test-user/test-repo.git"
+        mock_repo = FakeRepo(
+            name="test-repo",
+            full_name="test-user/test-repo",
+            description="Test repository",
+            private=False,
+            html_url="https://github.com/test-user/test-repo",
+            clone_url="https://github.com/test-user/test-repo.git",
+            ssh_url="git@github.com:test-user/test-repo.git",
+        )
 
         mock_user = mock.MagicMock()
         mock_user.create_repo.return_value = mock_repo
-        mock_github.return_value.get_user.return_value = mock_user
+        self.mock_github.return_value.get_user.return_value = mock_user
 
         # Create repository
         repo_info = create_repository("test-repo", "Test repository", False, "test-token")
@@ -65,8 +137,8 @@ class TestRepository(TestCase):
         self.assertEqual(repo_info["ssh_url"], "git@github.com:test-user/test-repo.git")
 
         # Verify API calls
-        mock_github.assert_called_once_with("test-token")
-        mock_github.return_value.get_user.assert_called_once()
+        self.mock_github.assert_called_once_with("test-token")
+        self.mock_github.return_value.get_user.assert_called_once()
         mock_user.create_repo.assert_called_once_with(
             name="test-repo",
             description="Test repository",
@@ -74,11 +146,10 @@ class TestRepository(TestCase):
             auto_init=True
         )
 
-    @mock.patch("hubqueue.repository.subprocess.run")
-    def test_clone_repository(self, mock_run):
+    def test_clone_repository(self):
         """Test cloning a repository."""
         # Mock subprocess.run
-        mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr="")
+        self.mock_run.return_value = OK
 
         # Clone repository
         repo_path = clone_repository("https://github.com/test-user/test-repo.git", "test-dir", "test-token")
@@ -87,18 +158,15 @@ class TestRepository(TestCase):
         self.assertEqual(repo_path, str(Path("test-dir").absolute()))
 
         # Verify subprocess call
-        mock_run.assert_called_once_with(
+        self.mock_run.assert_called_once_with(
             ["git", "clone", "https://test-token@github.com/test-user/test-repo.git", "test-dir"],
-            check=True,
-            capture_output=True,
-            text=True
+            **RUN_KW
         )
 
-    @mock.patch("hubqueue.repository.subprocess.run")
-    def test_init_repository(self, mock_run):
+    def test_init_repository(self):
         """Test initializing a repository."""
         # Mock subprocess.run
-        mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr="")
+        self.mock_run.return_value = OK
 
         # Initialize repository
         result = init_repository(self.temp_dir)
@@ -107,21 +175,11 @@ class TestRepository(TestCase):
         self.assertTrue(result)
 
         # Verify subprocess calls
-        self.assertEqual(mock_run.call_count, 2)
-        mock_run.assert_any_call(
-            ["git", "init"],
-            cwd=self.temp_dir,
-            check=True,
-            capture_output=True,
-            text=True
-        )
-        mock_run.assert_any_call(
-            ["git", "checkout", "-b", "main"],
-            cwd=self.temp_dir,
-            check=True,
-            capture_output=True,
-            text=True
-        )
+        self.assertEqual(self.mock_run.call_count, 2)
+        self.mock_run.assert_has_calls([
+            mock.call(["git", "init"], **self.run_kw),
+            mock.call(["git", "checkout", "-b", "main"], **self.run_kw),
+        ])
 
     def test_create_project_directories(self):
         """Test creating project directories."""
@@ -132,34 +190,29 @@ class TestRepository(TestCase):
         # Verify result
         self.assertEqual(len(created_dirs), 3)
         for dir_name in dirs:
-            dir_path = Path(self.temp_dir) / dir_name
+            dir_path = self.tmp / dir_name
             self.assertTrue(dir_path.exists())
             self.assertTrue(dir_path.is_dir())
 
-    @mock.patch("hubqueue.repository.subprocess.run")
-    def test_generate_gitignore(self, mock_run):
+    def test_generate_gitignore(self):
         """Test generating a .gitignore file."""
         # Mock subprocess.run
-        mock_run.return_value = subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="# Python gitignore template", stderr=""
-        )
+        self.mock_run.return_value = completed_process("# Python gitignore template")
 
         # Generate .gitignore
         gitignore_path = generate_gitignore(self.temp_dir, "Python")
 
         # Verify result
-        self.assertEqual(gitignore_path, str(Path(self.temp_dir) / ".gitignore"))
+        self.assertEqual(gitignore_path, str(self.tmp / ".gitignore"))
 
         # Verify subprocess call
-        mock_run.assert_called_once_with(
+        self.mock_run.assert_called_once_with(
             ["curl", "-s", "https://raw.githubusercontent.com/github/gitignore/main/Python.gitignore"],
-            check=True,
-            capture_output=True,
-            text=True
+            **RUN_KW
         )
 
         # Verify file content
-        with open(Path(self.temp_dir) / ".gitignore", "r") as f:
+        with open(self.tmp / ".gitignore", "r") as f:
             content = f.read()
             self.assertEqual(content, "# Python gitignore template")
 
@@ -169,10 +222,10 @@ class TestRepository(TestCase):
         readme_path = generate_readme(self.temp_dir, "Test Project", "A test project")
 
         # Verify result
-        self.assertEqual(readme_path, str(Path(self.temp_dir) / "README.md"))
+        self.assertEqual(readme_path, str(self.tmp / "README.md"))
 
         # Verify file content
-        with open(Path(self.temp_dir) / "README.md", "r") as f:
+        with open(self.tmp / "README.md", "r") as f:
             content = f.read()
             self.assertTrue("# Test Project" in content)
             self.assertTrue("A test project" in content)
@@ -186,20 +239,19 @@ class TestRepository(TestCase):
         license_path = generate_license(self.temp_dir, "MIT", "Test User")
 
         # Verify result
-        self.assertEqual(license_path, str(Path(self.temp_dir) / "LICENSE"))
+        self.assertEqual(license_path, str(self.tmp / "LICENSE"))
 
         # Verify file content
-        with open(Path(self.temp_dir) / "LICENSE", "r") as f:
+        with open(self.tmp / "LICENSE", "r") as f:
             content = f.read()
             self.assertTrue("MIT License" in content)
             self.assertTrue("Test User" in content)
             self.assertTrue("Permission is hereby granted" in content)
 
-    @mock.patch("hubqueue.repository.subprocess.run")
-    def test_create_branch(self, mock_run):
+    def test_create_branch(self):
         """Test creating a branch."""
         # Mock subprocess.run
-        mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr="")
+        self.mock_run.return_value = OK
 
         # Create branch
         branch_name = create_branch("feature-branch", "main", self.temp_dir)
@@ -208,38 +260,21 @@ class TestRepository(TestCase):
         self.assertEqual(branch_name, "feature-branch")
 
         # Verify subprocess calls
-        self.assertEqual(mock_run.call_count, 3)
-        mock_run.assert_any_call(
-            ["git", "checkout", "main"],
-            cwd=self.temp_dir,
-            check=True,
-            capture_output=True,
-            text=True
-        )
-        mock_run.assert_any_call(
-            ["git", "pull", "--ff-only"],
-            cwd=self.temp_dir,
-            check=True,
-            capture_output=True,
-            text=True
-        )
-        mock_run.assert_any_call(
-            ["git", "checkout", "-b", "feature-branch"],
-            cwd=self.temp_dir,
-            check=True,
-            capture_output=True,
-            text=True
-        )
-
-    @mock.patch("hubqueue.repository.subprocess.run")
-    def test_stage_and_commit(self, mock_run):
+        self.assertEqual(self.mock_run.call_count, 3)
+        self.mock_run.assert_has_calls([
+            mock.call(["git", "checkout", "main"], **self.run_kw),
+            mock.call(["git", "pull", "--ff-only"], **self.run_kw),
+            mock.call(["git", "checkout", "-b", "feature-branch"], **self.run_kw),
+        ])
+
+    def test_stage_and_commit(self):
         """Test staging and committing changes."""
         # Mock subprocess.run
-        mock_run.side_effect = [
-            subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr=""),  # git add
-            subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr=""),  # git commit
-            subprocess.CompletedProcess(args=[], returncode=0, stdout="abc123", stderr="")  # git rev-parse
-        ]
+        self.mock_run.side_effect = iter([
+            OK,  # git add
+            OK,  # git commit
+            completed_process("abc123")  # git rev-parse
+        ])
 
         # Stage and commit
         commit_hash = stage_and_commit("Test commit", self.temp_dir)
@@ -248,36 +283,31 @@ class TestRepository(TestCase):
         self.assertEqual(commit_hash, "abc123")
 
         # Verify subprocess calls
-        self.assertEqual(mock_run.call_count, 3)
-        mock_run.assert_any_call(
-            ["git", "add", "."],
-            cwd=self.temp_dir,
-            check=True,
-            capture_output=True,
-            text=True
-        )
-        mock_run.assert_any_call(
-            ["git", "commit", "-m", "Test commit"],
-            cwd=self.temp_dir,
-            check=True,
-            capture_output=True,
-            text=True
-        )
-        mock_run.assert_any_call(
-            ["git", "rev-parse", "HEAD"],
-            cwd=self.temp_dir,
-            check=True,
-            capture_output=True,
-            text=True
-        )
-
-    @mock.patch("hubqueue.repository.subprocess.run")
-    def test_push_commits(self, mock_run):
+        self.assertEqual(self.mock_run.call_count, 3)
+        self.mock_run.assert_has_calls([
+            mock.call(["git", "add", "."], **self.run_kw),
+            mock.call(["git", "commit", "-m", "Test commit"], **self.run_kw),
+            mock.call(["git", "rev-parse", "HEAD"], **self.run_kw),
+        ])
+
+    def test_stage_and_commit_files(self):
+        """Test staging specific files with a single git add."""
+        self.mock_run.side_effect = iter([OK, OK, completed_process("abc123")])
+
+        stage_and_commit("Test commit", self.temp_dir, ["a.py", "b.py"])
+
+        self.assertEqual(self.mock_run.call_count, 3)
+        self.mock_run.assert_has_calls([
+            mock.call(["git", "add", "--", "a.py", "b.py"], **self.run_kw),
+            mock.call(["git", "commit", "-m", "Test commit"], **self.run_kw),
+        ])
+
+    def test_push_commits(self):
         """Test pushing commits."""
         # Mock subprocess.run
-        mock_run.side_effect = [
-            subprocess.CompletedProcess(args=[], returncode=0, stdout="feature-branch", stderr=""),  # git rev-parse
-            subprocess.CompletedProcess(args=[], returncode=0, stdout="", stderr="")  # git push
+        self.mock_run.side_effect = [
+            completed_process("feature-branch"),  # git rev-parse
+            OK  # git push
         ]
 
         # Push commits
@@ -287,43 +317,29 @@ class TestRepository(TestCase):
         self.assertTrue(result)
 
         # Verify subprocess calls
-        self.assertEqual(mock_run.call_count, 2)
-        mock_run.assert_any_call(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            cwd=self.temp_dir,
-            check=True,
-            capture_output=True,
-            text=True
-        )
-        mock_run.assert_any_call(
-            ["git", "push", "-u", "origin", "feature-branch"],
-            cwd=self.temp_dir,
-            check=True,
-            capture_output=True,
-            text=True
-        )
+        self.assertEqual(self.mock_run.call_count, 2)
+        self.mock_run.assert_has_calls([
+            mock.call(["git", "rev-parse", "--abbrev-ref", "HEAD"], **self.run_kw),
+            mock.call(["git", "push", "-u", "origin", "feature-branch"], **self.run_kw),
+        ])
 
-    @mock.patch("hubqueue.repository.subprocess.run")
-    @mock.patch("hubqueue.repository.Github")
-    def test_create_pull_request(self, mock_github, mock_run):
+    def test_create_pull_request(self):
         """Test creating a pull request."""
         # Mock subprocess.run
-        mock_run.side_effect = [
-            subprocess.CompletedProcess(args=[], returncode=0, stdout="feature-branch", stderr=""),  # git rev-parse
-            subprocess.CompletedProcess(args=[], returncode=0, stdout="https://github.com/test-user/test-repo.git", stderr="")  # git remote
+        self.mock_run.side_effect = [
+            completed_process("feature-branch"),  # git rev-parse
+            completed_process("https://github.com/test-user/test-repo.git")  # git remote
         ]
 
         # Mock GitHub API
-        mock_pr = mock.MagicMock()
-        mock_pr.number = 123
-        mock_pr.title = "Test PR"
-        mock_pr.html_url = "https://github.com/test-user/test-repo/pull/123"
-        mock_pr.state = "open"
-
-        mock_repo = mock.MagicMock()
-        mock_repo.create_pull.return_value = mock_pr
+        mock_pr = FakePull(
+            number=123,
+            title="Test PR",
+            html_url="https://github.com/test-user/test-repo/pull/123",
+            state="open",
+        )
 
-        mock_github.return_value.get_repo.return_value = mock_repo
+        mock_repo = self.github_repo(self.mock_github, **{"create_pull.return_value": mock_pr})
 
         # Create pull request
         pr_info = create_pull_request("Test PR", "Test description", "main", "feature-branch", "test-user/test-repo", "test-token")
@@ -335,8 +351,8 @@ class TestRepository(TestCase):
         self.assertEqual(pr_info["state"], "open")
 
         # Verify API calls
-        mock_github.assert_called_once_with("test-token")
-        mock_github.return_value.get_repo.assert_called_once_with("test-user/test-repo")
+        self.mock_github.assert_called_once_with("test-token")
+        self.mock_github.return_value.get_repo.assert_called_once_with("test-user/test-repo")
         mock_repo.create_pull.assert_called_once_with(
             title="Test PR",
             body="Test description",
@@ -344,22 +360,20 @@ class TestRepository(TestCase):
             head="feature-branch"
         )
 
-    @mock.patch("hubqueue.repository.Github")
-    def test_fork_repository(self, mock_github):
+    def test_fork_repository(self):
         """Test forking a repository."""
         # Mock GitHub API
-        mock_fork = mock.MagicMock()
-        mock_fork.name = "test-repo"
-        mock_fork.full_name = "test-user/test-repo"
-        mock_fork.description = "Test repository"
-        mock_fork.html_url = "https://github.com/test-user/test-repo"
-        mock_fork.clone_url = "https://github.com/test-user/test-repo.git"
-        mock_fork.ssh_url = "git@github.com:test-user/test-repo.git"
-
-        mock_repo = mock.MagicMock()
-        mock_repo.create_fork.return_value = mock_fork
+        mock_fork = FakeRepo(
+            name="test-repo",
+            full_name="test-user/test-repo",
+            description="Test repository",
+            private=False,
+            html_url="https://github.com/test-user/test-repo",
+            clone_url="https://github.com/test-user/test-repo.git",
+            ssh_url="git@github.com:test-user/test-repo.git",
+        )
 
-        mock_github.return_value.get_repo.return_value = mock_repo
+        mock_repo = self.github_repo(self.mock_github, **{"create_fork.return_value": mock_fork})
 
         # Fork repository
         fork_info = fork_repository("original-user/test-repo", "test-token")
@@ -373,44 +387,45 @@ class TestRepository(TestCase):
         self.assertEqual(fork_info["ssh_url"], "git@github.com:test-user/test-repo.git")
 
         # Verify API calls
-        mock_github.assert_called_once_with("test-token")
-        mock_github.return_value.get_repo.assert_called_once_with("original-user/test-repo")
+        self.mock_github.assert_called_once_with("test-token")
+        self.mock_github.return_value.get_repo.assert_called_once_with("original-user/test-repo")
         mock_repo.create_fork.assert_called_once()
 
-    @mock.patch("hubqueue.repository.Github")
-    def test_manage_collaborators_add(self, mock_github):
-        """Test adding a collaborator."""
-        # Mock GitHub API
-        mock_repo = mock.MagicMock()
-        mock_github.return_value.get_repo.return_value = mock_repo
+    def test_manage_collaborators(self):
+        """Test adding and removing a collaborator."""
+        cases = [
+            (True, "add_to_collaborators", ("collaborator", "push"), "remove_from_collaborators"),
+            (False, "remove_from_collaborators", ("collaborator",), "add_to_collaborators"),
+        ]
+        for add, called, args, not_called in cases:
+            with self.subTest(add=add):
+                self.mock_github.reset_mock()
 
-        # Add collaborator
-        result = manage_collaborators("test-user/test-repo", "collaborator", "push", True, "test-token")
+                # Mock GitHub API
+                mock_repo = self.github_repo(self.mock_github)
 
-        # Verify result
-        self.assertTrue(result)
+                # Add or remove collaborator
+                result = manage_collaborators("test-user/test-repo", "collaborator", "push", add, "test-token")
 
-        # Verify API calls
-        mock_github.assert_called_once_with("test-token")
-        mock_github.return_value.get_repo.assert_called_once_with("test-user/test-repo")
-        mock_repo.add_to_collaborators.assert_called_once_with("collaborator", "push")
-        mock_repo.remove_from_collaborators.assert_not_called()
-
-    @mock.patch("hubqueue.repository.Github")
-    def test_manage_collaborators_remove(self, mock_github):
-        """Test removing a collaborator."""
-        # Mock GitHub API
-        mock_repo = mock.MagicMock()
-        mock_github.return_value.get_repo.return_value = mock_repo
+                # Verify result
+                self.assertTrue(result)
 
-        # Remove collaborator
-        result = manage_collaborators("test-user/test-repo", "collaborator", "push", False, "test-token")
+                # Verify API calls
+                self.mock_github.assert_called_once_with("test-token")
+                self.mock_github.return_value.get_repo.assert_called_once_with("test-user/test-repo")
+                getattr(mock_repo, called).assert_called_once_with(*args)
+                getattr(mock_repo, not_called).assert_not_called()
 
-        # Verify result
-        self.assertTrue(result)
 
-        # Verify API calls
-        mock_github.assert_called_once_with("test-token")
-        mock_github.return_value.get_repo.assert_called_once_with("test-user/test-repo")
-        mock_repo.add_to_collaborators.assert_not_called()
-        mock_repo.remove_from_collaborators.assert_called_once_with("collaborator")
+class TestRepositoryOnDisk(TestCase):
+    """Smoke-test repository file generation against the real filesystem."""
+
+    def test_generate_project_files(self):
+        """Test generating project files in a real directory."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            create_project_directories(temp_dir, ["src"])
+            readme_path = generate_readme(temp_dir, "Test Project", "A test project")
+
+            self.assertTrue((Path(temp_dir) / "src").is_dir())
+            with open(readme_path, "r") as f:
+                self.assertIn("# Test Project", f.read())
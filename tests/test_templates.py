@@ -1,29 +1,100 @@
 """
 Tests for the templates module.
 """
+import io
 import os
 import json
+import zipfile
 import tempfile
-import shutil
+from types import SimpleNamespace
 from unittest import TestCase, mock
 
+import pytest
+
 from hubqueue.templates import (
     list_templates, get_template, create_template, delete_template,
     import_template_from_github, import_template_from_url,
     generate_project, list_template_variables
 )
 
+# template.json contents, serialized compactly and encoded once at import
+_TEMPLATE1_JSON = json.dumps({
+    "name": "template1",
+    "description": "Test Template 1",
+    "version": "1.0.0",
+    "variables": {}
+}, separators=(",", ":")).encode()
+_TEMPLATE2_JSON = json.dumps({
+    "name": "template2",
+    "description": "Test Template 2",
+    "version": "2.0.0",
+    "variables": {}
+}, separators=(",", ":")).encode()
+_VARIABLES_TEMPLATE_JSON = json.dumps({
+    "name": "test-template",
+    "description": "Test Template",
+    "version": "1.0.0",
+    "variables": {
+        "project_name": {
+            "description": "Project name",
+            "default": "my-project"
+        },
+        "author": {
+            "description": "Author name",
+            "default": "John Doe"
+        }
+    }
+}, separators=(",", ":")).encode()
+
+
+def _mk(root, name, data):
+    """Create template directory name under an existing root with template.json data."""
+    template_dir = os.path.join(root, name)
+    os.mkdir(template_dir)
+    fd = os.open(os.path.join(template_dir, "template.json"), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    return template_dir
+
+
+def _zip_bytes(files):
+    """Build an in-memory zip archive from a {name: data} mapping."""
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        for name, data in files.items():
+            zf.writestr(name, data)
+    return buf.getvalue()
+
+
+# Downloaded archive and the read-only response serving it, shared by the import tests
+_TEMPLATE_ZIP = _zip_bytes({"template.json": _VARIABLES_TEMPLATE_JSON})
+_ZIP_RESPONSE = SimpleNamespace(content=_TEMPLATE_ZIP, raise_for_status=lambda: None)
 
+
+@pytest.fixture(scope="class")
+def shared_templates(request, fast_tmp_root):
+    """Build the read-only templates once for the requesting class."""
+    shared = tempfile.mkdtemp(dir=fast_tmp_root)
+    _mk(shared, "template1", _TEMPLATE1_JSON)
+    _mk(shared, "template2", _TEMPLATE2_JSON)
+    request.cls.shared_templates_dir = shared
+
+
+@pytest.mark.usefixtures("shared_templates")
 class TestTemplates(TestCase):
     """Test project templates and scaffolding functions."""
 
+    @pytest.fixture(autouse=True)
+    def _templates_dir(self, temp_dir):
+        """Give each test its own templates directory, removed with the session root."""
+        self.temp_dir = temp_dir
+        self.templates_dir = os.path.join(temp_dir, "templates")
+        os.mkdir(self.templates_dir)
+
     def setUp(self):
         """Set up test environment."""
-        # Create a temporary directory for tests
-        self.temp_dir = tempfile.mkdtemp()
-        self.templates_dir = os.path.join(self.temp_dir, "templates")
-        os.makedirs(self.templates_dir, exist_ok=True)
-        
         # Mock environment variables
         self.env_patcher = mock.patch.dict('os.environ', {}, clear=True)
         self.env_patcher.start()
@@ -31,9 +102,6 @@ class TestTemplates(TestCase):
     def tearDown(self):
         """Clean up test environment."""
         self.env_patcher.stop()
-        
-        # Clean up temporary directory
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
 
     def test_list_templates_empty(self):
         """Test listing templates when none exist."""
@@ -45,29 +113,8 @@ class TestTemplates(TestCase):
 
     def test_list_templates(self):
         """Test listing templates."""
-        # Create test templates
-        template1_dir = os.path.join(self.templates_dir, "template1")
-        os.makedirs(template1_dir, exist_ok=True)
-        with open(os.path.join(template1_dir, "template.json"), "w") as f:
-            json.dump({
-                "name": "template1",
-                "description": "Test Template 1",
-                "version": "1.0.0",
-                "variables": {}
-            }, f)
-        
-        template2_dir = os.path.join(self.templates_dir, "template2")
-        os.makedirs(template2_dir, exist_ok=True)
-        with open(os.path.join(template2_dir, "template.json"), "w") as f:
-            json.dump({
-                "name": "template2",
-                "description": "Test Template 2",
-                "version": "2.0.0",
-                "variables": {}
-            }, f)
-        
         # List templates
-        templates = list_templates(self.templates_dir)
+        templates = list_templates(self.shared_templates_dir)
         
         # Verify result
         self.assertEqual(len(templates), 2)
@@ -78,35 +125,24 @@ class TestTemplates(TestCase):
         self.assertEqual(templates[0]["name"], "template1")
         self.assertEqual(templates[0]["description"], "Test Template 1")
         self.assertEqual(templates[0]["version"], "1.0.0")
-        self.assertEqual(templates[0]["directory"], template1_dir)
+        self.assertEqual(templates[0]["directory"], os.path.join(self.shared_templates_dir, "template1"))
         
         self.assertEqual(templates[1]["name"], "template2")
         self.assertEqual(templates[1]["description"], "Test Template 2")
         self.assertEqual(templates[1]["version"], "2.0.0")
-        self.assertEqual(templates[1]["directory"], template2_dir)
+        self.assertEqual(templates[1]["directory"], os.path.join(self.shared_templates_dir, "template2"))
 
     def test_get_template(self):
         """Test getting a template."""
-        # Create test template
-        template_dir = os.path.join(self.templates_dir, "template1")
-        os.makedirs(template_dir, exist_ok=True)
-        with open(os.path.join(template_dir, "template.json"), "w") as f:
-            json.dump({
-                "name": "template1",
-                "description": "Test Template 1",
-                "version": "1.0.0",
-                "variables": {}
-            }, f)
-        
         # Get template
-        template = get_template("template1", self.templates_dir)
+        template = get_template("template1", self.shared_templates_dir)
         
         # Verify result
         self.assertIsNotNone(template)
         self.assertEqual(template["name"], "template1")
         self.assertEqual(template["description"], "Test Template 1")
         self.assertEqual(template["version"], "1.0.0")
-        self.assertEqual(template["directory"], template_dir)
+        self.assertEqual(template["directory"], os.path.join(self.shared_templates_dir, "template1"))
 
     def test_get_template_not_found(self):
         """Test getting a template that doesn't exist."""
@@ -167,15 +203,7 @@ class TestTemplates(TestCase):
     def test_delete_template(self):
         """Test deleting a template."""
         # Create test template
-        template_dir = os.path.join(self.templates_dir, "template1")
-        os.makedirs(template_dir, exist_ok=True)
-        with open(os.path.join(template_dir, "template.json"), "w") as f:
-            json.dump({
-                "name": "template1",
-                "description": "Test Template 1",
-                "version": "1.0.0",
-                "variables": {}
-            }, f)
+        template_dir = _mk(self.templates_dir, "template1", _TEMPLATE1_JSON)
         
         # Delete template
         result = delete_template("template1", self.templates_dir)
@@ -190,133 +218,102 @@ class TestTemplates(TestCase):
         with self.assertRaises(Exception):
             delete_template("nonexistent", self.templates_dir)
 
+    @mock.patch("hubqueue.templates.create_template")
     @mock.patch("hubqueue.templates.Github")
     @mock.patch("hubqueue.templates.requests.get")
-    def test_import_template_from_github(self, mock_requests_get, mock_github):
+    @mock.patch("zipfile.ZipFile")
+    @mock.patch("os.listdir", return_value=["test-user-test-repo-abc123"])
+    @mock.patch("os.path.isdir", return_value=True)
+    def test_import_template_from_github(self, mock_isdir, mock_listdir, mock_zipfile,
+                                         mock_requests_get, mock_github, mock_create_template):
         """Test importing a template from GitHub."""
         # Mock GitHub API
-        mock_repo = mock.MagicMock()
-        mock_repo.description = "Test Repository"
-        mock_repo.get_archive_link.return_value = "https://github.com/test-user/test-repo/archive/main.zip"
-        
-        mock_github.return_value.get_repo.return_value = mock_repo
+        fake_repo = SimpleNamespace(
+            description="Test Repository",
+            get_archive_link=mock.Mock(return_value="https://github.com/test-user/test-repo/archive/main.zip")
+        )
+        mock_github.return_value.get_repo.return_value = fake_repo
         
         # Mock requests.get
-        mock_response = mock.MagicMock()
-        mock_response.content = b"test content"
-        mock_requests_get.return_value = mock_response
+        mock_requests_get.return_value = _ZIP_RESPONSE
         
         # Mock zipfile extraction
-        with mock.patch("zipfile.ZipFile") as mock_zipfile:
-            mock_zip = mock.MagicMock()
-            mock_zipfile.return_value.__enter__.return_value = mock_zip
-            
-            # Mock os.listdir to return extracted directory
-            with mock.patch("os.listdir") as mock_listdir:
-                mock_listdir.return_value = ["test-user-test-repo-abc123"]
-                
-                # Mock os.path.isdir to return True for extracted directory
-                with mock.patch("os.path.isdir") as mock_isdir:
-                    mock_isdir.return_value = True
-                    
-                    # Mock create_template
-                    with mock.patch("hubqueue.templates.create_template") as mock_create_template:
-                        mock_create_template.return_value = {
-                            "name": "test-repo",
-                            "description": "Test Repository",
-                            "version": "1.0.0",
-                            "directory": os.path.join(self.templates_dir, "test-repo")
-                        }
-                        
-                        # Import template
-                        template = import_template_from_github(
-                            "test-user/test-repo",
-                            None,
-                            None,
-                            "test-token",
-                            self.templates_dir
-                        )
-                        
-                        # Verify result
-                        self.assertIsNotNone(template)
-                        self.assertEqual(template["name"], "test-repo")
-                        self.assertEqual(template["description"], "Test Repository")
-                        self.assertEqual(template["version"], "1.0.0")
-                        
-                        # Verify API calls
-                        mock_github.assert_called_once_with("test-token")
-                        mock_github.return_value.get_repo.assert_called_once_with("test-user/test-repo")
-                        mock_repo.get_archive_link.assert_called_once_with("zipball")
-                        mock_requests_get.assert_called_once_with("https://github.com/test-user/test-repo/archive/main.zip")
-                        mock_zipfile.assert_called_once()
-                        mock_zip.extractall.assert_called_once()
-                        mock_create_template.assert_called_once()
+        mock_zip = mock.MagicMock()
+        mock_zipfile.return_value.__enter__.return_value = mock_zip
+        
+        # Mock create_template
+        mock_create_template.return_value = {
+            "name": "test-repo",
+            "description": "Test Repository",
+            "version": "1.0.0",
+            "directory": os.path.join(self.templates_dir, "test-repo")
+        }
+        
+        # Import template
+        template = import_template_from_github(
+            "test-user/test-repo",
+            None,
+            None,
+            "test-token",
+            self.templates_dir
+        )
+        
+        # Verify result
+        self.assertIsNotNone(template)
+        self.assertEqual(template["name"], "test-repo")
+        self.assertEqual(template["description"], "Test Repository")
+        self.assertEqual(template["version"], "1.0.0")
+        
+        # Verify API calls
+        mock_github.assert_called_once_with("test-token")
+        mock_github.return_value.get_repo.assert_called_once_with("test-user/test-repo")
+        fake_repo.get_archive_link.assert_called_once_with("zipball")
+        mock_requests_get.assert_called_once_with("https://github.com/test-user/test-repo/archive/main.zip")
+        mock_zipfile.assert_called_once()
+        mock_zip.extractall.assert_called_once()
+        mock_create_template.assert_called_once()
 
+    @mock.patch("hubqueue.templates.create_template")
     @mock.patch("hubqueue.templates.requests.get")
-    def test_import_template_from_url(self, mock_requests_get):
+    def test_import_template_from_url(self, mock_requests_get, mock_create_template):
         """Test importing a template from a URL."""
-        # Mock requests.get
-        mock_response = mock.MagicMock()
-        mock_response.content = b"test content"
-        mock_requests_get.return_value = mock_response
+        # Mock requests.get with a real zip archive
+        mock_requests_get.return_value = _ZIP_RESPONSE
+        
+        # Mock create_template, checking the archive was extracted before the call
+        def fake_create_template(source_dir, *args):
+            with open(os.path.join(source_dir, "template.json"), "rb") as f:
+                self.assertEqual(f.read(), _VARIABLES_TEMPLATE_JSON)
+            return {
+                "name": "test-template",
+                "description": "Template imported from https://example.com/template.zip",
+                "version": "1.0.0",
+                "directory": os.path.join(self.templates_dir, "test-template")
+            }
+        mock_create_template.side_effect = fake_create_template
         
-        # Mock zipfile extraction
-        with mock.patch("zipfile.ZipFile") as mock_zipfile:
-            mock_zip = mock.MagicMock()
-            mock_zipfile.return_value.__enter__.return_value = mock_zip
-            
-            # Mock create_template
-            with mock.patch("hubqueue.templates.create_template") as mock_create_template:
-                mock_create_template.return_value = {
-                    "name": "test-template",
-                    "description": "Template imported from https://example.com/template.zip",
-                    "version": "1.0.0",
-                    "directory": os.path.join(self.templates_dir, "test-template")
-                }
-                
-                # Import template
-                template = import_template_from_url(
-                    "https://example.com/template.zip",
-                    "test-template",
-                    None,
-                    self.templates_dir
-                )
-                
-                # Verify result
-                self.assertIsNotNone(template)
-                self.assertEqual(template["name"], "test-template")
-                self.assertEqual(template["description"], "Template imported from https://example.com/template.zip")
-                self.assertEqual(template["version"], "1.0.0")
-                
-                # Verify API calls
-                mock_requests_get.assert_called_once_with("https://example.com/template.zip")
-                mock_zipfile.assert_called_once()
-                mock_zip.extractall.assert_called_once()
-                mock_create_template.assert_called_once()
+        # Import template
+        template = import_template_from_url(
+            "https://example.com/template.zip",
+            "test-template",
+            None,
+            self.templates_dir
+        )
+        
+        # Verify result
+        self.assertIsNotNone(template)
+        self.assertEqual(template["name"], "test-template")
+        self.assertEqual(template["description"], "Template imported from https://example.com/template.zip")
+        self.assertEqual(template["version"], "1.0.0")
+        
+        # Verify API calls
+        mock_requests_get.assert_called_once_with("https://example.com/template.zip")
+        mock_create_template.assert_called_once()
 
     def test_generate_project(self):
         """Test generating a project from a template."""
         # Create test template
-        template_dir = os.path.join(self.templates_dir, "test-template")
-        os.makedirs(template_dir, exist_ok=True)
-        
-        # Create template.json
-        with open(os.path.join(template_dir, "template.json"), "w") as f:
-            json.dump({
-                "name": "test-template",
-                "description": "Test Template",
-                "version": "1.0.0",
-                "variables": {
-                    "project_name": {
-                        "description": "Project name",
-                        "default": "my-project"
-                    },
-                    "author": {
-                        "description": "Author name",
-                        "default": "John Doe"
-                    }
-                }
-            }, f)
+        template_dir = _mk(self.templates_dir, "test-template", _VARIABLES_TEMPLATE_JSON)
         
         # Create template files
         with open(os.path.join(template_dir, "README.md"), "w") as f:
@@ -353,26 +350,7 @@ class TestTemplates(TestCase):
     def test_list_template_variables(self):
         """Test listing template variables."""
         # Create test template
-        template_dir = os.path.join(self.templates_dir, "test-template")
-        os.makedirs(template_dir, exist_ok=True)
-        
-        # Create template.json
-        with open(os.path.join(template_dir, "template.json"), "w") as f:
-            json.dump({
-                "name": "test-template",
-                "description": "Test Template",
-                "version": "1.0.0",
-                "variables": {
-                    "project_name": {
-                        "description": "Project name",
-                        "default": "my-project"
-                    },
-                    "author": {
-                        "description": "Author name",
-                        "default": "John Doe"
-                    }
-                }
-            }, f)
+        template_dir = _mk(self.templates_dir, "test-template", _VARIABLES_TEMPLATE_JSON)
         
         # List template variables
         variables = list_template_variables("test-template", self.templates_dir)
@@ -3,15 +3,15 @@ Tests for the ui module.
 """
 import os
 import sys
-import tempfile
 from unittest import TestCase, mock
 
+from hubqueue import ui
 from hubqueue.ui import (
     Color, print_color, print_header, print_info, print_success,
     print_warning, print_error, print_debug, print_table, print_json,
     print_progress_bar, print_spinner, prompt, confirm, select,
     multi_select, password, pause, clear_screen, set_color,
-    set_interactive, is_interactive, is_color_enabled, init_ui,
+    set_interactive, is_interactive, is_color_enabled,
     _supports_color, _get_terminal_width, _is_interactive, colorize
 )
 
@@ -19,35 +19,37 @@ from hubqueue.ui import (
 class TestUI(TestCase):
     """Test UI functions."""
 
-    def setUp(self):
-        """Set up test environment."""
-        # Create a temporary directory for tests
-        self.temp_dir = tempfile.mkdtemp()
+    # ANSI codes used in expected output
+    _RED = Color.RED.value
+    _BOLD = Color.BOLD.value
+    _RESET = Color.RESET.value
 
+    @classmethod
+    def setUpClass(cls):
+        """Set up the environment once for the class."""
         # Mock environment variables
-        self.env_patcher = mock.patch.dict('os.environ', {}, clear=True)
-        self.env_patcher.start()
+        cls.env_patcher = mock.patch.dict('os.environ', {}, clear=True)
+        cls.env_patcher.start()
 
         # Mock sys.stdout.isatty
-        self.isatty_patcher = mock.patch('sys.stdout.isatty', return_value=True)
-        self.isatty_patcher.start()
+        cls.isatty_patcher = mock.patch('sys.stdout.isatty', return_value=True)
+        cls.isatty_patcher.start()
 
         # Mock sys.stdin.isatty
-        self.stdin_isatty_patcher = mock.patch('sys.stdin.isatty', return_value=True)
-        self.stdin_isatty_patcher.start()
+        cls.stdin_isatty_patcher = mock.patch('sys.stdin.isatty', return_value=True)
+        cls.stdin_isatty_patcher.start()
 
-        # Initialize UI
-        init_ui()
+        # Start from color and interactive mode on, as init_ui() would under these
+        # patches; tests that change either reset it themselves
+        ui._use_color = True
+        ui._interactive = True
 
-    def tearDown(self):
-        """Clean up test environment."""
-        self.env_patcher.stop()
-        self.isatty_patcher.stop()
-        self.stdin_isatty_patcher.stop()
-
-        # Clean up temporary directory
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the class environment."""
+        cls.env_patcher.stop()
+        cls.isatty_patcher.stop()
+        cls.stdin_isatty_patcher.stop()
 
     def test_color_enum(self):
         """Test Color enum."""
@@ -163,8 +165,8 @@ class TestUI(TestCase):
         """Test colorize function."""
         # Test with color enabled
         set_color(True)
-        self.assertEqual(colorize("test", Color.RED), f"{Color.RED.value}test{Color.RESET.value}")
-        self.assertEqual(colorize("test", Color.RED, bold=True), f"{Color.BOLD.value}{Color.RED.value}test{Color.RESET.value}")
+        self.assertEqual(colorize("test", Color.RED), f"{self._RED}test{self._RESET}")
+        self.assertEqual(colorize("test", Color.RED, bold=True), f"{self._BOLD}{self._RED}test{self._RESET}")
 
         # Test with color disabled
         set_color(False)
@@ -179,7 +181,7 @@ class TestUI(TestCase):
         # Test with color enabled
         set_color(True)
         print_color("test", Color.RED)
-        mock_echo.assert_any_call(f"{Color.RED.value}test{Color.RESET.value}", nl=False)
+        mock_echo.assert_any_call(f"{self._RED}test{self._RESET}", nl=False)
 
         # Test with color disabled
         set_color(False)
@@ -189,35 +191,18 @@ class TestUI(TestCase):
         # Reset color for other tests
         set_color(True)
 
-    @mock.patch('click.echo')
-    def test_print_info(self, mock_echo):
-        """Test print_info function."""
-        print_info("test")
-        mock_echo.assert_any_call(f"{Color.CYAN.value}test{Color.RESET.value}", nl=False)
-
-    @mock.patch('click.echo')
-    def test_print_success(self, mock_echo):
-        """Test print_success function."""
-        print_success("test")
-        mock_echo.assert_any_call(f"{Color.GREEN.value}test{Color.RESET.value}", nl=False)
-
-    @mock.patch('click.echo')
-    def test_print_warning(self, mock_echo):
-        """Test print_warning function."""
-        print_warning("test")
-        mock_echo.assert_any_call(f"{Color.YELLOW.value}test{Color.RESET.value}", nl=False)
-
-    @mock.patch('click.echo')
-    def test_print_error(self, mock_echo):
-        """Test print_error function."""
-        print_error("test")
-        mock_echo.assert_any_call(f"{Color.RED.value}test{Color.RESET.value}", nl=False)
-
-    @mock.patch('click.echo')
-    def test_print_debug(self, mock_echo):
-        """Test print_debug function."""
-        print_debug("test")
-        mock_echo.assert_any_call(f"{Color.MAGENTA.value}test{Color.RESET.value}", nl=False)
+    def test_print_colored(self):
+        """Test print_info, print_success, print_warning, print_error and print_debug."""
+        for func, color in (
+            (print_info, Color.CYAN.value),
+            (print_success, Color.GREEN.value),
+            (print_warning, Color.YELLOW.value),
+            (print_error, Color.RED.value),
+            (print_debug, Color.MAGENTA.value),
+        ):
+            with self.subTest(func=func.__name__), mock.patch('click.echo') as mock_echo:
+                func("test")
+                mock_echo.assert_any_call(f"{color}test{self._RESET}", nl=False)
 
     @mock.patch('click.echo')
     def test_print_header(self, mock_echo):
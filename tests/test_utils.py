@@ -1,53 +1,58 @@
 """
 Tests for the utils module.
 """
-import os
-import json
 import tempfile
 from pathlib import Path
-from unittest import TestCase, mock
+from unittest import mock
+
+import pytest
 
 from hubqueue.utils import get_config_dir, save_config, load_config, get_github_token
 
 
-class TestUtils(TestCase):
-    """Test utility functions."""
-
-    def test_get_config_dir(self):
-        """Test that the config directory is created."""
-        with mock.patch("pathlib.Path.home") as mock_home:
-            mock_home.return_value = Path(tempfile.gettempdir())
-            config_dir = get_config_dir()
-            self.assertTrue(config_dir.exists())
-            self.assertEqual(config_dir, Path(tempfile.gettempdir()) / ".hubqueue")
-
-    def test_save_and_load_config(self):
-        """Test saving and loading configuration."""
-        test_config = {"github_token": "test-token", "default_repo": "owner/repo"}
-        
-        with mock.patch("hubqueue.utils.get_config_dir") as mock_get_config_dir:
-            temp_dir = Path(tempfile.mkdtemp())
-            mock_get_config_dir.return_value = temp_dir
-            
-            save_config(test_config)
-            loaded_config = load_config()
-            
-            self.assertEqual(loaded_config, test_config)
-            
-            # Clean up
-            (temp_dir / "config.json").unlink()
-            temp_dir.rmdir()
-
-    def test_get_github_token_from_env(self):
-        """Test getting GitHub token from environment variable."""
-        with mock.patch.dict(os.environ, {"GITHUB_TOKEN": "env-token"}):
-            token = get_github_token()
-            self.assertEqual(token, "env-token")
-
-    def test_get_github_token_from_config(self):
-        """Test getting GitHub token from config file."""
-        with mock.patch.dict(os.environ, {}, clear=True):
-            with mock.patch("hubqueue.utils.load_config") as mock_load_config:
-                mock_load_config.return_value = {"github_token": "config-token"}
-                token = get_github_token()
-                self.assertEqual(token, "config-token")
+@pytest.fixture(autouse=True)
+def _clear_config_dir_cache():
+    """Keep a config directory cached by one test, or a patched home, out of the next."""
+    get_config_dir.cache_clear()
+    yield
+    get_config_dir.cache_clear()
+
+
+def test_get_config_dir(fs_module):
+    """Test that the config directory is created."""
+    with mock.patch("pathlib.Path.home") as mock_home:
+        mock_home.return_value = Path(tempfile.gettempdir())
+        config_dir = get_config_dir()
+        assert config_dir.exists()
+        assert config_dir == Path(tempfile.gettempdir()) / ".hubqueue"
+
+
+def test_save_and_load_config(fs_module):
+    """Test saving and loading configuration."""
+    test_config = {"github_token": "test-token", "default_repo": "owner/repo"}
+    config_file = Path(tempfile.gettempdir()) / "config.json"
+
+    save_config(test_config, path=config_file)
+    loaded_config = load_config(path=config_file)
+
+    assert loaded_config == test_config
+
+
+def test_load_config_missing(fs_module):
+    """Test loading configuration when the file does not exist."""
+    assert load_config(path=Path(tempfile.gettempdir()) / "missing.json") == {}
+
+
+def test_get_github_token_from_env(monkeypatch):
+    """Test getting GitHub token from environment variable."""
+    monkeypatch.setenv("GITHUB_TOKEN", "env-token")
+    token = get_github_token()
+    assert token == "env-token"
+
+
+@mock.patch("hubqueue.utils.load_config", return_value={"github_token": "config-token"})
+def test_get_github_token_from_config(mock_load_config, monkeypatch):
+    """Test getting GitHub token from config file."""
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    token = get_github_token()
+    assert token == "config-token"